@@ -6,8 +6,9 @@ import json
 import time
 import random
 import string
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
 from urllib.parse import urlencode
 
 import requests
@@ -31,6 +32,14 @@ class BaiduPanAPI:
         self.timeout = APIConstants.DEFAULT_TIMEOUT
         self._executor = ThreadPoolExecutor(max_workers=APIConstants.MAX_WORKERS)
 
+        # 正在进行中的列表请求，相同参数的并发请求共享同一次网络调用
+        self._inflight_lock = threading.Lock()
+        self._inflight_lists: Dict[tuple, Future] = {}
+
+        # 用户信息 / 配额信息的短期缓存：key -> (写入时间, 数据)
+        self._profile_cache_lock = threading.Lock()
+        self._profile_cache: Dict[str, tuple] = {}
+
         # 认证状态
         self.current_account: Optional[str] = None
         self.access_token: Optional[str] = None
@@ -57,6 +66,10 @@ class BaiduPanAPI:
 
         return self.switch_account(current_account)
 
+    def reload_config(self):
+        """重新读取配置文件（其他实例如登录对话框保存了新的 token 后调用）"""
+        self.config = ConfigManager()
+
     def switch_account(self, account_name: str) -> bool:
         """切换到指定账号"""
         if not self.config.switch_account(account_name):
@@ -67,6 +80,7 @@ class BaiduPanAPI:
         if not account_data:
             return False
 
+        self.clear_profile_cache()
         self.current_account = account_name
         self.access_token = account_data.get('access_token')
         self.refresh_token = account_data.get('refresh_token')
@@ -89,6 +103,7 @@ class BaiduPanAPI:
 
     def logout(self):
         """退出登录（只重置当前状态，不清除tokens）"""
+        self.clear_profile_cache()
         self.current_account = None
         self.access_token = None
         self.refresh_token = None
@@ -127,6 +142,7 @@ class BaiduPanAPI:
             data = response.json()
 
             if 'access_token' in data:
+                self.clear_profile_cache()
                 self.current_account = account_name
                 self.access_token = data['access_token']
                 # 获取账户名称
@@ -277,10 +293,37 @@ class BaiduPanAPI:
             logger.error(f'JSON解析失败: {e}')
             return f'JSON解析失败: {e}'
 
+    def clear_profile_cache(self) -> None:
+        """清空用户信息和配额信息缓存（切换账号、退出登录时调用）"""
+        with self._profile_cache_lock:
+            self._profile_cache.clear()
+
+    def _get_profile_cached(self, key: str, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        带短期缓存的用户资料请求，有效期内直接返回上次成功的结果
+
+        Args:
+            key: 缓存键
+            endpoint: API 端点路径
+            params: 请求参数
+
+        Returns:
+            API 响应数据字典，失败时返回错误信息字符串或 None（失败结果不缓存）
+        """
+        with self._profile_cache_lock:
+            entry = self._profile_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < FileConstants.PROFILE_CACHE_TTL:
+            return entry[1]
+
+        result = self._make_request('GET', endpoint, params=params)
+        if isinstance(result, dict) and result.get('errno') == 0:
+            with self._profile_cache_lock:
+                self._profile_cache[key] = (time.monotonic(), result)
+        return result
+
     def get_user_info(self) -> Optional[Dict[str, Any]]:
         """获取用户信息"""
-        result = self._make_request('GET', '/rest/2.0/xpan/nas', params={'method': 'uinfo'})
-        return result
+        return self._get_profile_cached('uinfo', '/rest/2.0/xpan/nas', {'method': 'uinfo'})
 
     def get_member_type(self) -> str:
         """
@@ -310,13 +353,28 @@ class BaiduPanAPI:
 
     def get_quota(self) -> Optional[Dict[str, Any]]:
         """获取网盘配额信息"""
-        result = self._make_request('GET', '/api/quota', params={'checkfree': 1, 'checkexpire': 1})
-        return result
+        return self._get_profile_cached('quota', '/api/quota', {'checkfree': 1, 'checkexpire': 1})
+
+    def get_user_profile_bundle(self) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        并发获取用户信息和配额信息
+
+        两个请求同时发出，总耗时约为一次网络往返
+
+        Returns:
+            Tuple: (用户信息, 配额信息)
+        """
+        future_user = self._executor.submit(self.get_user_info)
+        future_quota = self._executor.submit(self.get_quota)
+        return future_user.result(), future_quota.result()
 
     def list_files(self, path: str = '/', start: int = 0, limit: int = FileConstants.DEFAULT_PAGE_SIZE, order: str = 'name', desc: int = 0) -> List[Dict[str, Any]]:
         """
         列出文件
 
+        相同参数的请求如果已在进行中（例如后台预取和用户点击同一目录），
+        直接等待并复用那次请求的结果，不再重复请求服务器。
+
         Args:
             path: 目录路径
             start: 起始位置
@@ -324,6 +382,30 @@ class BaiduPanAPI:
             order: 排序字段
             desc: 是否降序
         """
+        key = (self.current_account, path, start, limit, order, desc)
+        with self._inflight_lock:
+            future = self._inflight_lists.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight_lists[key] = Future()
+
+        if not is_owner:
+            logger.debug(f"复用进行中的文件列表请求: {path}")
+            return list(future.result())
+
+        try:
+            result = self._list_files(path, start, limit, order, desc)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight_lists.pop(key, None)
+
+    def _list_files(self, path: str, start: int, limit: int, order: str, desc: int) -> List[Dict[str, Any]]:
+        """请求服务器获取文件列表（由 list_files 调用）"""
         params = {
             'method': 'list',
             'dir': path,
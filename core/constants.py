@@ -65,7 +65,13 @@ class FileConstants:
     """文件管理相关常量"""
     MAX_LIST_LIMIT = 1000  # 文件列表每页最大数量
     DEFAULT_PAGE_SIZE = 1000  # 默认分页大小
+    LIST_PAGE_SIZE = 200  # 界面目录列表每页加载数量，滚动到底部时再加载下一页
     RECURSION_SEARCH_ENABLED = 1  # 启用递归搜索
+    DIR_CACHE_TTL = 30  # 目录列表缓存有效期（秒）
+    DIR_CACHE_MAX_ENTRIES = 256  # 内存中最多缓存的目录数量
+    PROFILE_CACHE_TTL = 60  # 用户信息、配额信息缓存有效期（秒）
+    PREFETCH_SUBDIR_LIMIT = 8  # 每次最多预取的子目录数量
+    PREFETCH_MAX_THREADS = 2  # 预取线程数，避免挤占前台加载
 
 
 # 认证相关常量
@@ -81,6 +81,7 @@ class TransferManager:
     def __init__(self):
         self.tasks: List[TransferTask] = []
         self.task_id_counter = 0
+        self._add_task_lock = threading.Lock()
         self.api_client = BaiduPanAPI()
         # 断点续传数据目录保存在运行目录下
         self.resume_data_dir = os.path.join(get_runtime_dir(), "resume_data")
@@ -299,9 +300,12 @@ class TransferManager:
             # 计算分片数
             total_chunks = (size + chunk_size - 1) // chunk_size if chunk_size > 0 else 0
 
-        self.task_id_counter += 1
+        # 拖拽上传时可能在多个线程中同时添加任务，编号分配需要加锁
+        with self._add_task_lock:
+            self.task_id_counter += 1
+            task_id = self.task_id_counter
         task = TransferTask(
-            task_id=self.task_id_counter,
+            task_id=task_id,
             name=name,
             remote_path=remote_path,
             size=size,
@@ -323,7 +327,8 @@ class TransferManager:
             # 下载任务不需要分片信息
             logger.info(f"文件下载: {name}, 大小: {size}")
 
-        self.tasks.append(task)
+        with self._add_task_lock:
+            self.tasks.append(task)
 
         # 立即保存断点续传数据（在添加任务时就保存，防止用户关闭软件）
         if local_path:  # 上传和下载任务都需要保存
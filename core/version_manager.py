@@ -8,6 +8,7 @@ import json
 import urllib.request
 import urllib.error
 import subprocess
+import time
 from typing import Optional, Tuple
 
 from PyQt5.QtWidgets import (
@@ -286,6 +287,7 @@ class DownloadThread(QThread):
                         total_size = int(response.headers.get('content-length', 0))
                         downloaded = 0
                         chunk_size = 1024 * 1024  # 1MB per chunk for faster download
+                        last_percent, last_emit = -1, 0.0
 
                         file_handle = open(self.save_path, 'wb')
                         try:
@@ -303,7 +305,11 @@ class DownloadThread(QThread):
 
                                 if total_size > 0:
                                     percent = int(downloaded * 100 / total_size)
-                                    self.progress.emit(percent, f"下载中... {percent}%")
+                                    # 进度变化且距上次发射超过 50ms 才通知界面
+                                    now = time.monotonic()
+                                    if percent != last_percent and (percent == 100 or now - last_emit >= 0.05):
+                                        last_percent, last_emit = percent, now
+                                        self.progress.emit(percent, f"下载中... {percent}%")
                         finally:
                             # 确保文件句柄被关闭
                             if file_handle:
@@ -8,7 +8,6 @@ from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineP
 from PyQt5.QtWidgets import *
 
 from core.api_client import BaiduPanAPI
-from gui.style import AppStyles
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,9 +29,7 @@ class LoginDialog(QDialog):
         self.setWindowTitle('百度网盘登录')
         self.setFixedSize(550, 750)
 
-        # 设置样式
-        self.setStyleSheet(AppStyles.get_stylesheet())
-
+        # 样式由主窗口设置在 QApplication 上，这里直接继承，不再重复解析整份样式表
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
         self.layout.setSpacing(15)
@@ -338,11 +335,11 @@ class WebPopup(QDialog):
     def on_url_changed(self, url):
         """URL变化时触发"""
         url_str = url.toString()
-        print(f"URL变化: {url_str}")
+        logger.debug("URL变化: %s", url_str)
 
         # 检查是否是我们想要监控的URL
         if '8.138.162.11:8939' in url_str:
-            print(f"检测到目标URL: {url_str}")
+            logger.debug("检测到目标URL: %s", url_str)
 
             # 从URL中提取授权码
             from urllib.parse import urlparse, parse_qs
@@ -351,7 +348,7 @@ class WebPopup(QDialog):
 
             if 'code' in params:
                 code = params['code'][0]
-                print(f"从URL获取到授权码: {code}")
+                logger.debug("从URL获取到授权码")
 
                 # 自动填入父对话框的输入框
                 self.parent_dialog.code_input.setText(code)
@@ -3,62 +3,176 @@
 """
 import os
 import time
+import concurrent.futures
 import threading
 import functools
+from contextlib import contextmanager
 from typing import Optional
 
 from PyQt5.QtWidgets import (
     QMainWindow, QApplication, QWidget, QVBoxLayout, QStackedWidget,
     QHBoxLayout, QLabel, QPushButton, QAbstractItemView, QSizePolicy,
-    QHeaderView, QShortcut, QFrame, QMenu, QMessageBox, QTableWidgetItem,
+    QHeaderView, QFrame, QMenu, QMessageBox, QTableWidgetItem,
     QDialog, QStatusBar, QProgressBar, QAction, QFileDialog,
     QLineEdit, QProgressDialog, QListWidget, QListWidgetItem,
     QStyle, QToolTip, QComboBox, QGroupBox, QTextEdit, QScrollArea
 )
 from PyQt5.QtCore import (
-    Qt, QTimer, QPoint, QRect
+    Qt, QTimer, QThreadPool, QSignalBlocker, QSignalMapper, pyqtSignal
 )
 from PyQt5.QtGui import QIcon, QKeySequence, QColor, QBrush
 
-from gui.login_dialog import LoginDialog
-
-
-class ClickableLabel(QLabel):
-    """可点击的 QLabel"""
-    def __init__(self, text, callback=None):
-        super().__init__(text)
-        self.callback = callback
-        if callback:
-            self.setCursor(Qt.PointingHandCursor)
-
-    def mousePressEvent(self, event):
-        if self.callback and event.button() == Qt.LeftButton:
-            self.callback()
-        super().mousePressEvent(event)
-
-
 from gui.share_dialog import ShareDialog
 from gui.file_properties_dialog import FilePropertiesDialog
 from core.api_client import BaiduPanAPI
 from gui.style import AppStyles
 from utils.logger import get_logger
 from utils.config_manager import ConfigManager
-from core.constants import AppConstants, UploadConstants, UIConstants
+from core.constants import AppConstants, UploadConstants, UIConstants, FileConstants
 
 # 从新模块导入
 from core.transfer_manager import TransferManager
 from core.version_manager import VersionManager, UpdateDialog
-from utils.worker import Worker
+from utils.worker import Worker, get_thread_pool
 from gui.widgets.table_widgets import DragDropTableWidget
 from gui.transfer_page import TransferPage
 from utils.file_utils import FileUtils
+from utils.dir_cache import DirCache
 
 logger = get_logger(__name__)
 
+# 关于对话框内容（只保留版本号占位，避免每次打开时重新拼接整段 HTML）
+_ABOUT_HTML = (
+    '<h2>百度网盘管理工具箱</h2>'
+    '<p>版本: {version}</p>'
+    '<p>一个简单易用的百度网盘管理工具</p>'
+    '<p>支持文件上传、下载、断点续传等功能</p>'
+)
+
+# 菜单快捷键（模块加载时解析一次）
+_SC_NEW = QKeySequence('Ctrl+N')
+_SC_OPEN = QKeySequence('Ctrl+O')
+_SC_QUIT = QKeySequence('Ctrl+Q')
+_SC_REFRESH = QKeySequence('F5')
+_SC_RENAME = QKeySequence('F2')
+_SC_DELETE = QKeySequence('Delete')
+_SC_COPY = QKeySequence('Ctrl+C')
+_SC_CUT = QKeySequence('Ctrl+X')
+_SC_PASTE = QKeySequence('Ctrl+V')
+_SC_FILE_PAGE = QKeySequence('Ctrl+1')
+_SC_TRANSFER_PAGE = QKeySequence('Ctrl+2')
+
+# 文件大小单位对应的字节数（parse_size 使用，单位已去掉末尾的 B）
+_SIZE_MULT = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+# 文件夹名称中不允许出现的字符（Windows 非法字符）
+_ILLEGAL_NAME_CHARS = frozenset('<>:"/\\|?*')
+
+# 搜索框样式（字数超限时切换为红色边框）
+_SEARCH_INPUT_QSS = """
+    QLineEdit {
+        padding: 5px 10px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background: white;
+    }
+    QLineEdit:focus {
+        border: 1px solid #4A90E2;
+    }
+"""
+_SEARCH_INPUT_OVER_LIMIT_QSS = """
+    QLineEdit {
+        padding: 5px 10px;
+        border: 1px solid #e74c3c;
+        border-radius: 4px;
+        background: white;
+    }
+    QLineEdit:focus {
+        border: 1px solid #e74c3c;
+    }
+"""
+_SEARCH_HINT_QSS = "color: #e74c3c; font-size: 11px;"
+_SEARCH_HINT_ERROR_QSS = (
+    "color: #e74c3c; font-size: 11px; background: #fadbd8; padding: 3px 8px; border-radius: 3px;"
+)
+
+# 文件扩展名对应的 QStyle 标准图标
+# 图片 - SP_DialogOpenButton，音频 - SP_MediaVolume，视频 - SP_MediaPlay，
+# 压缩包 - SP_DriveCDIcon，文档及其他 - SP_FileIcon
+_EXT_ICON_TYPES = {
+    **dict.fromkeys(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'), QStyle.SP_DialogOpenButton),
+    **dict.fromkeys(('.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'), QStyle.SP_MediaVolume),
+    **dict.fromkeys(('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.rmvb'), QStyle.SP_MediaPlay),
+    **dict.fromkeys(('.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'), QStyle.SP_DriveCDIcon),
+    **dict.fromkeys(('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'), QStyle.SP_FileIcon),
+}
+
+class _RowData(dict):
+    """文件表格行数据
+
+    普通 dict 存入 Qt.UserRole 时 PyQt 会逐项转换为 QVariantMap，每次读取又转换回新的 dict；
+    dict 子类按 Python 对象引用保存，存取都不需要转换。
+    """
+    __slots__ = ()
+
+
+# 主题图标缓存，避免每次重建页面都重新解析图标主题
+_ICON_CACHE = {}
+
+
+def _theme_icon(name: str) -> QIcon:
+    """获取主题图标（带缓存）"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = QIcon.fromTheme(name)
+    return icon
+
+
+def _list_files_for_table(api_client, **kwargs):
+    """
+    加载目录列表（在工作线程中调用）
+
+    同时把表格要显示的大小和时间文本格式化一遍，结果进入 FileUtils 的缓存，
+    界面线程填充表格时只需查缓存。
+
+    Args:
+        api_client: API 客户端
+        **kwargs: 传给 list_files 的参数
+
+    Returns:
+        文件列表
+    """
+    files = api_client.list_files(**kwargs)
+    if isinstance(files, list):
+        format_size = FileUtils.format_size
+        format_time = FileUtils.format_time
+        for file in files:
+            if not file.get('isdir', 0):
+                format_size(file.get('size') or 0)
+            format_time(file.get('local_mtime', 0))
+    return files
+
+
+class ClickableLabel(QLabel):
+    """可点击的 QLabel"""
+    def __init__(self, text, callback=None):
+        super().__init__(text)
+        self.callback = callback
+        if callback:
+            self.setCursor(Qt.PointingHandCursor)
+
+    def mousePressEvent(self, event):
+        if self.callback and event.button() == Qt.LeftButton:
+            self.callback()
+        super().mousePressEvent(event)
+
 
 class MainWindow(QMainWindow):
     """主窗口"""
 
+    # 上传线程通过该信号通知上传完成，回调在界面线程中执行
+    upload_completed = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
 
@@ -74,12 +188,17 @@ class MainWindow(QMainWindow):
         # 初始化组件
         self.original_text = None  # 存储原始文本
         self.renaming_item = None  # 正在重命名的项
+        self._name_set = None  # 当前表格中的文件名集合，行增删后置空，用到时再重建
+        self._clipboard = QApplication.clipboard()  # 系统剪贴板
+        self._file_icons = {}  # 文件类型图标缓存 {QStyle 标准图标: QIcon}
         self.config = ConfigManager()
         self.api_client = None
+        self._api_clients = {}  # 按账号复用的 API 客户端 {账号名: BaiduPanAPI}
         self.scanner = None
 
         # 传输管理器
         self.transfer_manager = TransferManager()
+        self.transfer_page = None  # 传输页面，第一次使用时再创建
         # 读取下载线程数配置
         max_threads = self.config.get_max_download_threads()
         self.transfer_manager.update_download_thread_limit(max_threads)
@@ -88,13 +207,46 @@ class MainWindow(QMainWindow):
         self.sort_column = 0  # 0:文件名, 1:大小, 2:修改时间
         self.sort_order = 'asc'  # 'asc':升序, 'desc':降序
         self.current_file_list = []  # 保存当前加载的文件列表
+        self._populating = False  # 正在批量填充表格，期间忽略 itemChanged
+        self._has_more_files = False  # 当前目录是否还有未加载的分页
+        self._more_files_worker = None  # 加载下一页的线程
+        self._sorted_locally = False  # 用户点击表头对当前目录做过本地排序
+
+        # 目录列表缓存（切换回最近访问过的目录时不再请求服务器）
+        self.dir_cache = DirCache()
+        # 后台清理过期的目录缓存和已不存在账号的缓存
+        self.dir_cache.prune(self.config.get_all_accounts())
+        # 子目录预取使用独立的小线程池，不占用前台加载的线程
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(FileConstants.PREFETCH_MAX_THREADS)
+        self._prefetch_workers = []
+        # 提前配置共享线程池的线程上限（新建文件夹等任务直接使用全局线程池）
+        get_thread_pool()
 
         # 版本管理器
         self.version_manager = VersionManager()
 
         # 扫描相关
         self.current_worker = None  # 当前工作线程
-        self.progress_dialog = None
+        self._user_info_worker = None  # 用户信息刷新线程
+        self._login_worker = None  # 登录后初始数据加载线程
+        self._auto_login_worker = None  # 自动登录认证线程
+        self._last_double_click_time = 0.0  # 上次双击时间，用于过滤重复双击
+
+        # 目录加载防抖：连续刷新/点击面包屑时只加载最后一次请求的目录
+        self._pending_update = None  # (路径, 是否强制刷新)
+        self._update_items_timer = QTimer(self)
+        self._update_items_timer.setSingleShot(True)
+        self._update_items_timer.setInterval(120)
+        self._update_items_timer.timeout.connect(self._flush_pending_update)
+
+        # 状态栏文字节流：高频进度回调只保留最新一条，最多每 50ms 刷新一次
+        self._pending_status = None  # (文字, 是否同时显示为状态栏消息)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+        self.progress_dialog = None  # 拖拽上传进度框，创建一次后重复使用
 
         # 复制粘贴相关
         self.copied_files = []  # 保存复制的文件信息列表
@@ -183,8 +335,8 @@ class MainWindow(QMainWindow):
             self.startup_label.deleteLater()
             self.startup_label = None
 
-        # 检查自动登录
-        self.check_auto_login()
+        # 检查自动登录（放到事件循环中执行，窗口先完成首次绘制）
+        QTimer.singleShot(0, self.check_auto_login)
 
         # 启动后延迟自动检查更新（1秒后）
         QTimer.singleShot(1000, lambda: self.check_for_updates(auto_check=True))
@@ -205,38 +357,66 @@ class MainWindow(QMainWindow):
         last_used_account = self.config.load_last_used_account()
 
         if last_used_account:
-            # 使用 QTimer 延迟调用，让界面先显示
-            QTimer.singleShot(10, lambda: self.attempt_auto_login(last_used_account))
+            self.attempt_auto_login(last_used_account)
             return
 
         # 没有最近使用的账号，显示登录页面
         self.stacked_widget.setCurrentWidget(self.login_page)
 
     def attempt_auto_login(self, account_name):
-        """尝试自动登录指定账号"""
+        """尝试自动登录指定账号（认证检查在后台线程中进行）"""
         try:
-            # 创建 API 客户端
-            self.api_client = BaiduPanAPI()
+            # 获取 API 客户端并切换到指定账号（只读写本地配置）
+            self._ensure_api_client(account_name)
+        except Exception as e:
+            logger.warning(f"自动登录过程中出错: {e}")
+            self.stacked_widget.setCurrentWidget(self.login_page)
+            return
 
-            # 尝试切换到指定账号
-            self.api_client.switch_account(account_name)
+        self.show_status_progress(f"正在登录: {account_name}")
+        self._auto_login_worker = Worker(func=self._do_auto_login, account_name=account_name)
+        self._auto_login_worker.finished.connect(self._on_auto_login_checked)
+        self._auto_login_worker.error.connect(self._on_auto_login_error)
+        self._auto_login_worker.start()
 
-            # 检查认证状态（如果需要自动刷新token）
-            if self.api_client.is_authenticated():
-                self.current_account = account_name
+    def _do_auto_login(self, account_name):
+        """
+        检查认证状态（在工作线程中执行，token 即将过期时会请求刷新）
 
-                # 使用 QTimer 延迟调用，让界面先刷新
-                QTimer.singleShot(10, self.complete_auto_login)
+        Args:
+            account_name: 账号名称
 
-        except Exception as e:
-            logger.warning(f"自动登录过程中出错: {e}")
+        Returns:
+            tuple: (是否认证成功, 账号名称)
+        """
+        return self.api_client.is_authenticated(), account_name
+
+    def _on_auto_login_checked(self, result):
+        """自动登录认证检查完成"""
+        self._auto_login_worker = None
+        authenticated, account_name = result
+        if not authenticated:
+            logger.info(f"账号 {account_name} 认证失败，显示登录页面")
+            self.hide_status_progress()
             self.stacked_widget.setCurrentWidget(self.login_page)
+            return
+
+        self.current_account = account_name
+        self.complete_auto_login()
+
+    def _on_auto_login_error(self, error):
+        """自动登录认证检查出错"""
+        self._auto_login_worker = None
+        logger.warning(f"自动登录过程中出错: {error}")
+        self.hide_status_progress()
+        self.stacked_widget.setCurrentWidget(self.login_page)
 
     def complete_auto_login(self):
         """完成自动登录后的处理"""
         try:
             # 同步 token 到 transfer_manager（快速）
             if self.api_client.access_token:
+                self.transfer_manager.api_client.clear_profile_cache()
                 self.transfer_manager.api_client.access_token = self.api_client.access_token
                 self.transfer_manager.api_client.current_account = self.api_client.current_account
 
@@ -248,6 +428,9 @@ class MainWindow(QMainWindow):
             # 更新状态栏
             self.status_label.setText(f"已自动登录: {self.current_account}，正在加载数据...")
 
+            # 先显示上次保存的根目录，服务器数据返回后再替换
+            self._show_last_root_listing()
+
             # 延迟加载，让界面先显示
             QTimer.singleShot(100, self._start_async_login)
 
@@ -256,6 +439,21 @@ class MainWindow(QMainWindow):
             self.hide_status_progress()
             self.stacked_widget.setCurrentWidget(self.login_page)
 
+    def _show_last_root_listing(self):
+        """显示磁盘缓存中上次加载的根目录（即使已过期）
+
+        只用于启动时尽快显示内容，最新列表加载完成前表格保持禁用。
+        """
+        cached = self.dir_cache.get(self.current_account, '/', max_age=float('inf'))
+        if not cached:
+            return
+
+        self.current_path = '/'
+        self.update_breadcrumb('/')
+        self._reset_file_paging(cached)
+        self.set_list_items(cached)
+        self.file_table.setEnabled(False)
+
     def _start_async_login(self):
         """开始异步加载数据 - 并行加载三个请求"""
         try:
@@ -263,37 +461,11 @@ class MainWindow(QMainWindow):
             self._set_all_buttons_enabled(False)
             self.show_status_progress("正在加载数据...")
 
-            # 在后台线程中并行加载所有数据
-            def load_all_in_thread():
-                try:
-                    import concurrent.futures
-
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                        # 同时提交三个任务
-                        future_user = executor.submit(self.api_client.get_user_info)
-                        future_quota = executor.submit(self.api_client.get_quota)
-                        future_files = executor.submit(self.api_client.list_files, '/')
-
-                        # 等待所有任务完成
-                        results = {}
-                        for future, name in [(future_user, 'user'), (future_quota, 'quota'), (future_files, 'files')]:
-                            try:
-                                results[name] = future.result()
-                            except Exception as e:
-                                logger.error(f"加载{name}失败: {e}")
-                                results[name] = None
-
-                    # 所有请求完成后，通过回调更新UI
-                    callback = functools.partial(self._process_auto_login_data, results)
-                    QTimer.singleShot(0, callback)
-
-                except Exception as e:
-                    logger.error(f"并行加载数据出错: {e}")
-                    callback = functools.partial(self._process_auto_login_data, {})
-                    QTimer.singleShot(0, callback)
-
-            thread = threading.Thread(target=load_all_in_thread, daemon=True)
-            thread.start()
+            # 在线程池中并行加载所有数据，完成后通过信号回到主线程更新UI
+            self._login_worker = Worker(func=self._fetch_initial_data)
+            self._login_worker.finished.connect(self._process_auto_login_data)
+            self._login_worker.error.connect(lambda e: self._process_auto_login_data({}))
+            self._login_worker.start()
 
         except Exception as e:
             logger.error(f"启动异步加载失败: {e}")
@@ -311,18 +483,7 @@ class MainWindow(QMainWindow):
         self._cached_quota_info = quota_info
 
         if user_info and quota_info:
-            used = quota_info.get('used', 0)
-            total = quota_info.get('total', 0)
-            used_gb = used / (1024 ** 3)
-            total_gb = total / (1024 ** 3)
-
-            baidu_name = user_info.get('baidu_name')
-            uk = user_info.get('uk')
-            info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
-
-            self.user_info_label.setText(info_text)
-            self.user_info_label_nav.setText(f"{baidu_name}")
-            logger.info(f"用户: {baidu_name} (UK: {uk})")
+            self._show_user_info(user_info, quota_info)
 
         # 恢复按钮状态
         self._set_all_buttons_enabled(True)
@@ -330,58 +491,6 @@ class MainWindow(QMainWindow):
         self.show_status_progress("正在恢复任务...")
         QTimer.singleShot(10, lambda: self._finish_auto_login_with_files(results.get('files')))
 
-    def _on_user_info_loaded(self, user_info):
-        """用户信息加载完成"""
-        self._cached_user_info = user_info
-        self.show_status_progress("正在加载配额信息...")
-
-        # 继续加载配额信息
-        worker2 = Worker(func=self.api_client.get_quota)
-        worker2.finished.connect(self._on_quota_loaded)
-        worker2.error.connect(self._on_quota_error)
-        worker2.start()
-
-    def _on_user_info_error(self, error):
-        """用户信息加载错误"""
-        logger.error(f"获取用户信息失败: {error}")
-        self._cached_user_info = None
-        # 继续加载配额
-        worker2 = Worker(func=self.api_client.get_quota)
-        worker2.finished.connect(self._on_quota_loaded)
-        worker2.error.connect(self._on_quota_error)
-        worker2.start()
-
-    def _on_quota_loaded(self, quota_info):
-        """配额信息加载完成"""
-        self._cached_quota_info = quota_info
-
-        # 更新UI显示
-        user_info = self._cached_user_info
-        if user_info and quota_info:
-            used = quota_info.get('used', 0)
-            total = quota_info.get('total', 0)
-            used_gb = used / (1024 ** 3)
-            total_gb = total / (1024 ** 3)
-
-            baidu_name = user_info.get('baidu_name')
-            uk = user_info.get('uk')
-            info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
-
-            self.user_info_label.setText(info_text)
-            self.user_info_label_nav.setText(f"{baidu_name}")
-            logger.info(f"用户: {baidu_name} (UK: {uk})")
-
-        self.show_status_progress("正在恢复任务...")
-        # 设置UK并恢复任务
-        QTimer.singleShot(10, self._finish_auto_login)
-
-    def _on_quota_error(self, error):
-        """配额信息加载错误"""
-        logger.error(f"获取配额信息失败: {error}")
-        self._cached_quota_info = None
-        # 继续完成流程
-        QTimer.singleShot(10, self._finish_auto_login)
-
     def _load_login_data_sync(self):
         """同步加载登录数据（备用方案）- 并行加载"""
         try:
@@ -393,7 +502,7 @@ class MainWindow(QMainWindow):
             with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                 future_user = executor.submit(self.api_client.get_user_info)
                 future_quota = executor.submit(self.api_client.get_quota)
-                future_files = executor.submit(self.api_client.list_files, '/')
+                future_files = executor.submit(self.api_client.list_files, '/', limit=FileConstants.LIST_PAGE_SIZE)
 
                 user_info = future_user.result()
                 quota_info = future_quota.result()
@@ -404,18 +513,7 @@ class MainWindow(QMainWindow):
 
             # 更新UI显示
             if user_info and quota_info:
-                used = quota_info.get('used', 0)
-                total = quota_info.get('total', 0)
-                used_gb = used / (1024 ** 3)
-                total_gb = total / (1024 ** 3)
-
-                baidu_name = user_info.get('baidu_name')
-                uk = user_info.get('uk')
-                info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
-
-                self.user_info_label.setText(info_text)
-                self.user_info_label_nav.setText(f"{baidu_name}")
-                logger.info(f"用户: {baidu_name} (UK: {uk})")
+                self._show_user_info(user_info, quota_info)
 
             # 恢复按钮状态
             self._set_all_buttons_enabled(True)
@@ -428,24 +526,6 @@ class MainWindow(QMainWindow):
         # 设置UK并恢复任务
         QTimer.singleShot(10, lambda: self._finish_auto_login_with_files(files))
 
-    def _finish_auto_login(self):
-        """完成自动登录"""
-        try:
-            # 设置UK
-            if self._cached_user_info:
-                uk = self._cached_user_info.get('uk')
-                if uk:
-                    self.transfer_manager.set_user_uk(uk)
-
-            # 恢复未完成的任务
-            self.transfer_manager.resume_incomplete_tasks()
-        except Exception as e:
-            logger.error(f"完成自动登录时出错: {e}")
-
-        # 隐藏进度条并加载文件列表
-        self.hide_status_progress()
-        QTimer.singleShot(10, lambda: self.update_items("/"))
-
     def _finish_auto_login_with_files(self, files):
         """完成自动登录（带文件列表）"""
         try:
@@ -467,7 +547,10 @@ class MainWindow(QMainWindow):
         # 如果已经有文件列表，直接显示
         if files:
             self.current_path = '/'
+            self._store_dir_cache('/', files)
+            self._reset_file_paging(files)
             self.set_list_items(files)
+            self.file_table.setEnabled(True)
             # 加载完成后恢复按钮状态
             self._set_all_buttons_enabled(True)
         else:
@@ -476,11 +559,13 @@ class MainWindow(QMainWindow):
 
     def setup_ui(self):
         """设置UI"""
-        self.setWindowTitle(AppConstants.APP_NAME)
-        self.setMinimumSize(AppConstants.WINDOW_MIN_WIDTH, AppConstants.WINDOW_MIN_HEIGHT)
+        # 窗口标题和最小尺寸已在 __init__ 中设置，这里不再重复设置，避免窗口已显示后再次触发几何调整
 
-        # 设置样式
-        self.setStyleSheet(AppStyles.get_stylesheet())
+        # 设置样式（应用到整个程序，子窗口和对话框直接继承，不再各自解析一遍）
+        app = QApplication.instance()
+        stylesheet = AppStyles.get_stylesheet()
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
         # 创建中央部件
         central_widget = QWidget()
@@ -502,7 +587,11 @@ class MainWindow(QMainWindow):
         # 创建页面
         self.setup_login_page()
         self.setup_file_manage_page()
-        self.setup_transfer_page()
+
+        # 传输页面延迟到第一次切换或添加任务时创建，这里只注册上传完成回调，自动刷新文件列表
+        # 回调在上传线程中触发，经信号转到界面线程后再修改表格
+        self.upload_completed.connect(self.on_upload_complete)
+        self.transfer_manager.set_upload_complete_callback(self.upload_completed.emit)
 
         # 创建状态栏
         self.setup_statusbar()
@@ -581,6 +670,28 @@ class MainWindow(QMainWindow):
         self.user_info_widget.setVisible(False)
         top_nav_layout.addWidget(self.user_info_widget)
 
+    @staticmethod
+    def _add_shortcut_action(widget, key, slot, context):
+        """
+        为部件添加快捷键动作
+
+        Args:
+            widget: 快捷键所属部件
+            key: 快捷键
+            slot: 触发时调用的方法（triggered 的 checked 参数会传给第一个可选参数）
+            context: 快捷键生效范围
+        """
+        action = QAction(widget)
+        action.setShortcut(key)
+        action.setShortcutContext(context)
+        action.triggered.connect(slot)
+        widget.addAction(action)
+        return action
+
+    def refresh_current_dir(self):
+        """强制刷新当前目录"""
+        self.update_items(self.current_path, force=True)
+
     def switch_to_file_manage_page(self):
         """切换到文件管理页面"""
         self.stacked_widget.setCurrentWidget(self.file_manage_page)
@@ -589,7 +700,7 @@ class MainWindow(QMainWindow):
 
     def switch_to_transfer_page(self):
         """切换到传输页面"""
-        self.stacked_widget.setCurrentWidget(self.transfer_page)
+        self.stacked_widget.setCurrentWidget(self._ensure_transfer_page())
         self.transfer_btn.setChecked(True)
         self.file_manage_btn.setChecked(False)
 
@@ -654,7 +765,7 @@ class MainWindow(QMainWindow):
         self.refresh_btn.setObjectName("info")
         self.refresh_btn.setMaximumWidth(45)
         self.refresh_btn.setMinimumWidth(45)
-        self.refresh_btn.clicked.connect(lambda: self.update_items(self.current_path))
+        self.refresh_btn.clicked.connect(self.refresh_current_dir)
         button_layout.addWidget(self.refresh_btn)
 
         # 搜索框容器（用于垂直布局搜索框和提示）
@@ -668,17 +779,8 @@ class MainWindow(QMainWindow):
         self.search_input.setPlaceholderText("🔍 搜索文件...")
         self.search_input.setMaximumWidth(200)
         self.search_input.setMinimumWidth(150)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 5px 10px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background: white;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4A90E2;
-            }
-        """)
+        self.search_input.setStyleSheet(_SEARCH_INPUT_QSS)
+        self._search_over_limit = False  # 搜索框当前是否为超限样式
         self.search_input.returnPressed.connect(self.on_search)
         # 监听文本变化，实时检查长度
         self.search_input.textChanged.connect(self._on_search_input_changed)
@@ -686,7 +788,7 @@ class MainWindow(QMainWindow):
 
         # 搜索提示标签
         self.search_hint_label = QLabel()
-        self.search_hint_label.setStyleSheet("color: #e74c3c; font-size: 11px;")
+        self.search_hint_label.setStyleSheet(_SEARCH_HINT_QSS)
         self.search_hint_label.setMaximumWidth(200)
         self.search_hint_label.hide()  # 默认隐藏
         search_layout.addWidget(self.search_hint_label)
@@ -740,6 +842,7 @@ class MainWindow(QMainWindow):
         self.breadcrumb_layout.setContentsMargins(5, 5, 5, 5)
         self.breadcrumb_layout.setSpacing(5)
         # 初始面包屑（显示根目录）
+        self._init_breadcrumb()
         self.update_breadcrumb("/")
         user_layout.addWidget(self.breadcrumb_widget)
 
@@ -749,6 +852,8 @@ class MainWindow(QMainWindow):
         self.file_table.setHorizontalHeaderLabels(['文件名', '大小', '修改时间'])
         self.file_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.file_table.horizontalHeader().setStretchLastSection(True)
+        # 行高固定，不按内容计算，大目录填充和滚动时不用逐行测量
+        self.file_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.file_table.verticalHeader().setDefaultSectionSize(UIConstants.TABLE_ROW_HEIGHT)
         self.file_table.verticalHeader().setVisible(False)  # 隐藏行号
         self.file_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -770,6 +875,15 @@ class MainWindow(QMainWindow):
         # 连接表头点击事件用于排序
         header.sectionClicked.connect(self.on_header_clicked)
 
+        # 滚动到底部附近时加载下一页
+        self.file_table.verticalScrollBar().valueChanged.connect(self._on_file_table_scrolled)
+
+        # 行增删后文件名集合失效（批量填充时表格信号被屏蔽，但模型信号不受影响）
+        model = self.file_table.model()
+        model.rowsInserted.connect(self._invalidate_name_set)
+        model.rowsRemoved.connect(self._invalidate_name_set)
+        model.modelReset.connect(self._invalidate_name_set)
+
         # 初始化表头显示
         self.update_header_labels()
 
@@ -787,15 +901,19 @@ class MainWindow(QMainWindow):
         # 监听当前项改变（用于检测新建文件夹失去焦点）
         self.file_table.currentItemChanged.connect(self.on_current_item_changed)
 
-        # 添加快捷键
-        QShortcut(QKeySequence("F5"), self.file_table).activated.connect(lambda: self.update_items(self.current_path))
-        QShortcut(QKeySequence("F2"), self.file_table).activated.connect(self.rename_file)
-        QShortcut(QKeySequence("Delete"), self.file_table).activated.connect(self.delete_file)
-        QShortcut(QKeySequence("Ctrl+1"), self).activated.connect(self.switch_to_file_manage_page)
-        QShortcut(QKeySequence("Ctrl+2"), self).activated.connect(self.switch_to_transfer_page)
-        QShortcut(QKeySequence("Ctrl+C"), self.file_table).activated.connect(self.copy_files)
-        QShortcut(QKeySequence("Ctrl+X"), self.file_table).activated.connect(self.cut_files)
-        QShortcut(QKeySequence("Ctrl+V"), self.file_table).activated.connect(self.paste_files)
+        # 添加快捷键（文件操作只在文件管理页面内生效，页面切换在整个窗口生效）
+        page_shortcuts = (
+            (_SC_REFRESH, self.refresh_current_dir),
+            (_SC_RENAME, self.rename_file),
+            (_SC_DELETE, self.delete_file),
+            (_SC_COPY, self.copy_files),
+            (_SC_CUT, self.cut_files),
+            (_SC_PASTE, self.paste_files),
+        )
+        for key, slot in page_shortcuts:
+            self._add_shortcut_action(file_manage_page, key, slot, Qt.WidgetWithChildrenShortcut)
+        self._add_shortcut_action(self, _SC_FILE_PAGE, self.switch_to_file_manage_page, Qt.WindowShortcut)
+        self._add_shortcut_action(self, _SC_TRANSFER_PAGE, self.switch_to_transfer_page, Qt.WindowShortcut)
 
         user_layout.addWidget(self.file_table)
         main_layout.addWidget(user_card)
@@ -822,8 +940,14 @@ class MainWindow(QMainWindow):
         self.transfer_page = TransferPage(self)
         self.stacked_widget.addWidget(self.transfer_page)
 
-        # 设置上传完成回调，自动刷新文件列表
-        self.transfer_page.transfer_manager.set_upload_complete_callback(self.on_upload_complete)
+    def _ensure_transfer_page(self) -> TransferPage:
+        """获取传输页面，不存在时创建
+
+        传输页面带有定时刷新，登录后不一定会用到，因此不在启动时创建。
+        """
+        if self.transfer_page is None:
+            self.setup_transfer_page()
+        return self.transfer_page
 
     # 登录页面
     def setup_login_page(self):
@@ -858,7 +982,7 @@ class MainWindow(QMainWindow):
         login_button = QPushButton('登录百度网盘')
         login_button.setObjectName('authbut')
         login_button.setMinimumHeight(50)
-        login_button.setIcon(QIcon.fromTheme('network-workgroup'))
+        login_button.setIcon(_theme_icon('network-workgroup'))
         login_button.clicked.connect(self.open_authorization_dialog)
         card_layout.addWidget(login_button)
 
@@ -875,122 +999,149 @@ class MainWindow(QMainWindow):
         self.login_page = login_page
 
     def handle_dropped_files(self, file_paths):
-        """处理拖拽的文件 - 支持大文件分片上传和断点续传"""
+        """处理拖拽的文件 - 支持大文件分片上传和断点续传
+
+        文件通过传输页面批量提交（在线程池中检查并添加任务），
+        进度由批次信号驱动，不再阻塞界面。
+        """
         if not self.api_client or not self.api_client.is_authenticated():
             QMessageBox.warning(self, "提示", "请先登录百度网盘账号")
             return
 
         total_files = len(file_paths)
-        uploaded_count = 0
-        failed_files = []
+        if not total_files:
+            return
 
         # 显示进度对话框
-        progress_dialog = QProgressDialog(
-            f"正在处理文件... (0/{total_files})",
-            "取消",
-            0,
-            total_files,
-            self
-        )
-        progress_dialog.setWindowTitle("上传进度")
-        progress_dialog.setWindowModality(Qt.WindowModal)
-        progress_dialog.setMinimumDuration(0)
+        progress_dialog = self._reset_drop_progress_dialog(total_files)
 
-        for i, file_path in enumerate(file_paths):
-            if progress_dialog.wasCanceled():
-                break
+        state = {'uploaded': 0, 'submitted': 0, 'label_time': 0.0}
+        # 文件名只计算一次，进度提示和结果汇总都按序号取用
+        file_names = [os.path.basename(file_path) for file_path in file_paths]
+        failed_files = []
+        empty_files = []
+        large_files = []
+        remote_path = self.current_path
+        batch = self._ensure_transfer_page().add_upload_tasks(file_paths, remote_path)
+        progress_dialog.canceled.connect(batch.cancel)
 
-            try:
-                # 更新进度
+        def on_submitted(index, file_path, success, file_size):
+            file_name = file_names[index]
+
+            if success:
+                state['uploaded'] += 1
+                if file_size > UploadConstants.CHUNK_SIZE:
+                    # 大文件，分片上传并支持断点续传
+                    total_chunks = (file_size + UploadConstants.CHUNK_SIZE - 1) // UploadConstants.CHUNK_SIZE
+                    size_text = self._format_size(file_size)
+                    self._set_status(
+                        f"已添加分片上传任务: {file_name} "
+                        f"({size_text}, {total_chunks}个分片, 支持断点续传)"
+                    )
+                    if file_size > UploadConstants.LARGE_FILE_THRESHOLD:
+                        large_files.append((file_name, size_text, total_chunks))
+            elif file_size == 0:
+                empty_files.append(file_name)
+            elif file_size is not None or not batch.is_canceled():
+                failed_files.append(file_name)
+
+            # 提示文字最多每 50ms 更新一次，最后处理完的文件总是显示
+            state['submitted'] += 1
+            now = time.monotonic()
+            if (not progress_dialog.wasCanceled()
+                    and (now - state['label_time'] >= 0.05 or state['submitted'] == total_files)):
+                state['label_time'] = now
                 progress_dialog.setLabelText(
-                    f"正在处理文件 ({i + 1}/{total_files})\n"
-                    f"文件名: {os.path.basename(file_path)}"
+                    f"正在处理文件 ({index + 1}/{total_files})\n"
+                    f"文件名: {file_name}"
                 )
-                progress_dialog.setValue(i)
 
-                # 获取文件信息
-                file_size = os.path.getsize(file_path)
-                file_name = os.path.basename(file_path)
+        def on_progress(done, total):
+            if not progress_dialog.wasCanceled():
+                progress_dialog.setValue(done)
 
-                # 检查文件大小
-                if file_size == 0:
-                    QMessageBox.warning(self, "警告", f"文件 '{file_name}' 为空，跳过上传")
-                    continue
+        def on_all_submitted():
+            # 进度框会被下次拖拽复用，断开本批次的取消信号；达到最大值后进度框自动重置并隐藏
+            try:
+                progress_dialog.canceled.disconnect(batch.cancel)
+            except TypeError:
+                pass
+            progress_dialog.setValue(total_files)
+            uploaded_count = state['uploaded']
+
+            if empty_files:
+                QMessageBox.warning(
+                    self, "警告",
+                    "以下文件为空，已跳过上传：\n" + "\n".join(empty_files[:10]) +
+                    ("\n..." if len(empty_files) > 10 else "")
+                )
 
-                # 检查是否需要分片上传
-                if file_size > UploadConstants.CHUNK_SIZE:
-                    # 大文件，需要分片上传并显示断点续传状态
-                    total_chunks = (file_size + UploadConstants.CHUNK_SIZE - 1) // UploadConstants.CHUNK_SIZE
+            # 如果有很大的文件，显示提示
+            for file_name, size_text, total_chunks in large_files[:3]:
+                QMessageBox.information(
+                    self,
+                    "大文件上传",
+                    f"文件 '{file_name}' 较大 ({size_text})\n"
+                    f"已启用分片上传 ({total_chunks}个分片)\n"
+                    f"支持断点续传，可在传输页面查看进度\n"
+                    f"上传过程中请不要关闭程序"
+                )
 
-                    # 添加上传任务（自动启用分片上传和断点续传）
-                    task = self.transfer_page.add_upload_task(
-                        file_path,
-                        self.current_path,
-                        enable_resume=True
-                    )
+            # 显示结果
+            if failed_files:
+                QMessageBox.warning(
+                    self,
+                    "上传结果",
+                    f"成功添加 {uploaded_count}/{total_files} 个上传任务\n\n"
+                    f"失败的文件：\n" + "\n".join(failed_files[:10]) +
+                    ("\n..." if len(failed_files) > 10 else "") + "\n\n"
+                                                                  f"分片上传任务可在传输页面查看和管理"
+                )
+            else:
+                QMessageBox.information(
+                    self,
+                    "上传任务已添加",
+                    f"成功添加 {uploaded_count} 个上传任务\n"
+                    f"分片上传任务支持断点续传，请到传输页面查看进度"
+                )
 
-                    if task:
-                        self.status_label.setText(
-                            f"已添加分片上传任务: {file_name} "
-                            f"({self.format_size(file_size)}, {total_chunks}个分片, 支持断点续传)"
-                        )
-                        uploaded_count += 1
-
-                        # 如果文件很大，显示提示
-                        if file_size > UploadConstants.LARGE_FILE_THRESHOLD:
-                            QMessageBox.information(
-                                self,
-                                "大文件上传",
-                                f"文件 '{file_name}' 较大 ({self.format_size(file_size)})\n"
-                                f"已启用分片上传 ({total_chunks}个分片)\n"
-                                f"支持断点续传，可在传输页面查看进度\n"
-                                f"上传过程中请不要关闭程序"
-                            )
-                    else:
-                        failed_files.append(file_path)
-                else:
-                    # 小文件，直接上传
-                    task = self.transfer_page.add_upload_task(
-                        file_path,
-                        self.current_path
-                    )
-                    if task:
-                        uploaded_count += 1
-                    else:
-                        failed_files.append(file_path)
+            # 切换到传输页面
+            self.switch_to_transfer_page()
 
-            except Exception as e:
-                logger.error(f"处理文件失败 {file_path}: {e}")
-                failed_files.append(file_path)
+            # 刷新文件列表
+            self._invalidate_dir_cache(remote_path)
+            self.update_items(self.current_path)
 
-            # 处理事件，保持界面响应
-            QApplication.processEvents()
+        batch.file_submitted.connect(on_submitted)
+        batch.progress.connect(on_progress)
+        # 结果提示框延迟到下一次事件循环，避免在进度框的 setValue 中弹出
+        batch.finished.connect(lambda: QTimer.singleShot(0, on_all_submitted))
 
-        progress_dialog.setValue(total_files)
+    def _reset_drop_progress_dialog(self, total_files):
+        """
+        获取并重置拖拽上传进度框（只创建一次，之后重复使用）
 
-        # 显示结果
-        if failed_files:
-            QMessageBox.warning(
-                self,
-                "上传结果",
-                f"成功添加 {uploaded_count}/{total_files} 个上传任务\n\n"
-                f"失败的文件：\n" + "\n".join([os.path.basename(f) for f in failed_files[:10]]) +
-                ("\n..." if len(failed_files) > 10 else "") + "\n\n"
-                                                              f"分片上传任务可在传输页面查看和管理"
-            )
-        else:
-            QMessageBox.information(
-                self,
-                "上传任务已添加",
-                f"成功添加 {uploaded_count} 个上传任务\n"
-                f"分片上传任务支持断点续传，请到传输页面查看进度"
-            )
+        Args:
+            total_files: 本次拖拽的文件数量
 
-        # 切换到传输页面
-        self.switch_to_transfer_page()
+        Returns:
+            QProgressDialog: 已显示的进度框
+        """
+        dialog = self.progress_dialog
+        if dialog is None:
+            dialog = self.progress_dialog = QProgressDialog(self)
+            dialog.setWindowTitle("上传进度")
+            dialog.setCancelButtonText("取消")
+            dialog.setWindowModality(Qt.WindowModal)
+            dialog.setMinimumDuration(0)
+        else:
+            dialog.reset()
 
-        # 刷新文件列表
-        self.update_items(self.current_path)
+        dialog.setLabelText(f"正在处理文件... (0/{total_files})")
+        dialog.setRange(0, total_files)
+        dialog.setValue(0)
+        dialog.show()
+        return dialog
 
     def handle_rows_moved(self, rows_data, target_folder_path):
         """处理表格内行移动（文件移动到文件夹）"""
@@ -1028,6 +1179,9 @@ class MainWindow(QMainWindow):
         if not source_paths:
             return
 
+        # 源目录和目标目录的缓存都将过期
+        self._invalidate_dir_cache(self.current_path, target_folder_path)
+
         # 设置操作进行中标志
         self.is_operation_in_progress = True
 
@@ -1040,9 +1194,7 @@ class MainWindow(QMainWindow):
         self._set_transfer_buttons_enabled(False)
 
         # 使用 Worker 异步移动
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        self._stop_current_worker()
 
         self.current_worker = Worker(
             func=self.api_client.move_files,
@@ -1058,13 +1210,14 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         self._set_transfer_buttons_enabled(True)
 
         # 从表格中删除已移动的行（从后往前删除，避免行号变化）
         if hasattr(self, 'rows_to_move') and self.rows_to_move:
-            for row in sorted(self.rows_to_move, reverse=True):
-                self.file_table.removeRow(row)
+            with self._bulk_table_update() as table:
+                for row in sorted(self.rows_to_move, reverse=True):
+                    table.removeRow(row)
 
             # 清理
             delattr(self, 'rows_to_move')
@@ -1079,7 +1232,7 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         self._set_transfer_buttons_enabled(True)
 
         QMessageBox.warning(self, "移动失败", f"移动文件失败: {error_msg}")
@@ -1178,35 +1331,38 @@ class MainWindow(QMainWindow):
     def _refresh_cut_visual_state(self):
         """刷新剪切状态的视觉效果"""
         try:
-            if not self.cut_mode:
-                # 清除所有剪切高亮 - 恢复默认颜色
-                for row in range(self.file_table.rowCount()):
-                    for col in range(self.file_table.columnCount()):
-                        item = self.file_table.item(row, col)
-                        if item:
-                            # 使用 setData 清除前景色
-                            item.setData(Qt.ForegroundRole, None)
-            else:
-                # 显示剪切高亮（灰色）
-                for row in range(self.file_table.rowCount()):
-                    name_item = self.file_table.item(row, 0)
-                    if name_item:
-                        data = name_item.data(Qt.UserRole)
-                        if data and self.cut_files_original_paths:
-                            path = data.get('path', '')
-                            # 检查是否是被剪切的文件
-                            if path in self.cut_files_original_paths:
-                                # 设置灰色文字
-                                for col in range(self.file_table.columnCount()):
-                                    item = self.file_table.item(row, col)
-                                    if item:
-                                        item.setData(Qt.ForegroundRole, QBrush(QColor(150, 150, 150)))
-
-            # 强制重绘
-            self.file_table.viewport().update()
+            # 逐个单元格修改前景色，批量进行，避免每个单元格都触发 itemChanged 和重绘
+            with self._bulk_table_update():
+                self._apply_cut_visual_state()
         except Exception as e:
             logger.error(f"刷新剪切视觉效果时出错: {e}")
 
+    def _apply_cut_visual_state(self):
+        """设置剪切状态的前景色（由 _refresh_cut_visual_state 在批量更新状态下调用）"""
+        if not self.cut_mode:
+            # 清除所有剪切高亮 - 恢复默认颜色
+            for row in range(self.file_table.rowCount()):
+                for col in range(self.file_table.columnCount()):
+                    item = self.file_table.item(row, col)
+                    if item:
+                        # 使用 setData 清除前景色
+                        item.setData(Qt.ForegroundRole, None)
+        else:
+            # 显示剪切高亮（灰色）
+            for row in range(self.file_table.rowCount()):
+                name_item = self.file_table.item(row, 0)
+                if name_item:
+                    data = name_item.data(Qt.UserRole)
+                    if data and self.cut_files_original_paths:
+                        path = data.get('path', '')
+                        # 检查是否是被剪切的文件
+                        if path in self.cut_files_original_paths:
+                            # 设置灰色文字
+                            for col in range(self.file_table.columnCount()):
+                                item = self.file_table.item(row, col)
+                                if item:
+                                    item.setData(Qt.ForegroundRole, QBrush(QColor(150, 150, 150)))
+
     def paste_files(self):
         """粘贴文件到当前目录"""
         # 检查是否正在加载文件或切换账号
@@ -1259,9 +1415,7 @@ class MainWindow(QMainWindow):
         self._set_transfer_buttons_enabled(False)
 
         # 使用 Worker 异步移动
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        self._stop_current_worker()
 
         self.current_worker = Worker(
             func=self.api_client.move_files,
@@ -1351,9 +1505,7 @@ class MainWindow(QMainWindow):
         self._copied_files_backup = files_to_copy
 
         # 使用 Worker 异步复制
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        self._stop_current_worker()
 
         self.current_worker = Worker(
             func=self.api_client.copy_files,
@@ -1369,7 +1521,7 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         self._set_transfer_buttons_enabled(True)
 
         # 获取实际复制的文件数量和备份
@@ -1401,7 +1553,7 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         self._set_transfer_buttons_enabled(True)
 
         QMessageBox.warning(self, "复制失败", f"复制文件失败: {error_msg}")
@@ -1412,14 +1564,15 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         self._set_transfer_buttons_enabled(True)
 
         # 删除在当前目录的源文件（从后往前删除，避免行号变化）
         if hasattr(self, '_rows_to_remove') and self._rows_to_remove:
-            for row in sorted(self._rows_to_remove, reverse=True):
-                if row < self.file_table.rowCount():
-                    self.file_table.removeRow(row)
+            with self._bulk_table_update() as table:
+                for row in sorted(self._rows_to_remove, reverse=True):
+                    if row < table.rowCount():
+                        table.removeRow(row)
 
         # 如果源文件不在当前目录，添加移动到当前目录的文件
         source_parent_dirs = getattr(self, '_source_parent_dirs', set())
@@ -1436,8 +1589,11 @@ class MainWindow(QMainWindow):
                 files_to_add.append((file_name, new_file_data))
 
             # 添加到表格的合适位置（保持排序）
-            for file_name, file_data in files_to_add:
-                self._add_file_item_sorted(file_name, file_data)
+            with self._bulk_table_update():
+                for file_name, file_data in files_to_add:
+                    self._add_file_item_sorted(file_name, file_data)
+
+        self._invalidate_dir_cache(self.current_path, *source_parent_dirs)
 
         # 清理临时变量
         for attr in ['_rows_to_remove', '_source_parent_dirs']:
@@ -1489,13 +1645,10 @@ class MainWindow(QMainWindow):
 
             # 创建文件名项（带图标）
             name_item = QTableWidgetItem(file_name)
-            name_item.setData(Qt.UserRole, file_data)
+            self._set_row_data(name_item, file_data)
 
-            # 设置图标（文件夹或文件）
-            if is_dir:
-                name_item.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
-            else:
-                name_item.setIcon(self.style().standardIcon(QStyle.SP_FileIcon))
+            # 设置图标（与目录列表一致，按文件类型显示）
+            name_item.setIcon(self.get_file_type_icon(file_name, is_dir))
 
             self.file_table.setItem(insert_row, 0, name_item)
 
@@ -1504,7 +1657,6 @@ class MainWindow(QMainWindow):
             logger.info(f"[DEBUG] 文件 {file_name} 大小: {size}, 类型: {type(size)}")
 
             if not is_dir and size is not None and size > 0:
-                from utils.file_utils import FileUtils
                 size_text = FileUtils.format_size(size)
                 logger.info(f"[DEBUG] 格式化后大小: {size_text}")
             else:
@@ -1518,7 +1670,7 @@ class MainWindow(QMainWindow):
             logger.info(f"[DEBUG] 文件 {file_name} mtime: {mtime}, 类型: {type(mtime)}")
 
             if mtime and mtime > 0:
-                time_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))
+                time_text = FileUtils.format_time(mtime)
                 logger.info(f"[DEBUG] 格式化后时间: {time_text}")
             else:
                 time_text = ''
@@ -1545,28 +1697,28 @@ class MainWindow(QMainWindow):
             new_file_data = file_data.copy()
             new_file_data['path'] = new_path
 
-            # 添加行到表格
-            row = self.file_table.rowCount()
-            self.file_table.insertRow(row)
+            with self._bulk_table_update():
+                # 添加行到表格
+                row = self.file_table.rowCount()
+                self.file_table.insertRow(row)
 
-            # 设置各个列的数据
-            name_item = QTableWidgetItem(file_name)
-            name_item.setData(Qt.UserRole, new_file_data)
-            self.file_table.setItem(row, 0, name_item)
+                # 设置各个列的数据
+                name_item = QTableWidgetItem(file_name)
+                self._set_row_data(name_item, new_file_data)
+                self.file_table.setItem(row, 0, name_item)
 
-            # 大小
-            size = file_data.get('size', 0)
-            if not file_data.get('is_dir'):
-                from utils.file_utils import FileUtils
-                size_text = FileUtils.format_size(size)
-            else:
-                size_text = ''
-            self.file_table.setItem(row, 1, QTableWidgetItem(size_text))
+                # 大小
+                size = file_data.get('size', 0)
+                if not file_data.get('is_dir'):
+                    size_text = FileUtils.format_size(size)
+                else:
+                    size_text = ''
+                self.file_table.setItem(row, 1, QTableWidgetItem(size_text))
 
-            # 修改时间
-            mtime = file_data.get('mtime', 0)
-            time_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime)) if mtime else ''
-            self.file_table.setItem(row, 2, QTableWidgetItem(time_text))
+                # 修改时间
+                mtime = file_data.get('mtime', 0)
+                time_text = FileUtils.format_time(mtime) if mtime else ''
+                self.file_table.setItem(row, 2, QTableWidgetItem(time_text))
 
         except Exception as e:
             logger.error(f"添加文件项到表格时出错: {e}")
@@ -1576,7 +1728,7 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         self._set_transfer_buttons_enabled(True)
 
         if self.cut_mode:
@@ -1604,60 +1756,57 @@ class MainWindow(QMainWindow):
         if not file_paths:
             return
 
-        for file_path in file_paths:
-            # 添加上传任务
-            task = self.transfer_page.add_upload_task(file_path, self.current_path)
+        # 批量添加上传任务（在线程池中提交）
+        batch = self._ensure_transfer_page().add_upload_tasks(file_paths, self.current_path)
 
+        def on_submitted(index, file_path, success, file_size):
             # 显示通知
-            self.status_label.setText(f"已添加上传任务: {os.path.basename(file_path)}")
+            if success:
+                self.status_label.setText(f"已添加上传任务: {os.path.basename(file_path)}")
 
-    # 下载文件
-    def download_selected_file(self):
-        """下载选中的文件"""
-        # 检查是否正在加载文件或切换账号
-        if self.is_loading_files or self.is_switching_account:
-            return
+        batch.file_submitted.connect(on_submitted)
 
+    # 下载文件
     def on_upload_complete(self, task):
-        """上传完成回调"""
+        """上传完成回调（由 upload_completed 信号在界面线程中调用）"""
         logger.info(f"上传完成回调: {task.name}, 路径: {task.remote_path}")
+        self._invalidate_dir_cache(task.remote_path)
 
         # 如果上传路径是当前路径，直接在表格中添加 item
         if task.remote_path == self.current_path:
             logger.info(f"上传完成，添加文件到表格: {task.name}")
 
-            # 在表格末尾添加一行
-            row_count = self.file_table.rowCount()
-            self.file_table.insertRow(row_count)
-
-            # 构造文件完整路径
-            full_path = f"{task.remote_path.rstrip('/')}/{task.name}"
-
-            # 名称列
-            name_item = QTableWidgetItem(task.name)
-            file_data = {
-                'path': full_path,
-                'is_dir': False,
-                'fs_id': int(time.time() * 1000)  # 使用时间戳作为临时 fs_id
-            }
-            name_item.setData(Qt.UserRole, file_data)
-
-            tooltip_text = f"路径: {full_path}\n大小: {FileUtils.format_size(task.size)}"
-            name_item.setData(Qt.UserRole + 1, tooltip_text)
+            # 程序写入的表格项不是用户编辑，批量更新期间屏蔽 itemChanged
+            with self._bulk_table_update():
+                # 在表格末尾添加一行
+                row_count = self.file_table.rowCount()
+                self.file_table.insertRow(row_count)
+
+                # 构造文件完整路径
+                full_path = f"{task.remote_path.rstrip('/')}/{task.name}"
+
+                # 名称列
+                name_item = QTableWidgetItem(task.name)
+                file_data = {
+                    'path': full_path,
+                    'is_dir': False,
+                    'fs_id': int(time.time() * 1000)  # 使用时间戳作为临时 fs_id
+                }
+                self._set_row_data(name_item, file_data)
 
-            # 设置文件类型图标
-            icon = self.get_file_type_icon(task.name, is_dir=False)
-            name_item.setIcon(icon)
+                # 设置文件类型图标
+                icon = self.get_file_type_icon(task.name, is_dir=False)
+                name_item.setIcon(icon)
 
-            self.file_table.setItem(row_count, 0, name_item)
+                self.file_table.setItem(row_count, 0, name_item)
 
-            # 大小列
-            size_str = FileUtils.format_size(task.size)
-            self.file_table.setItem(row_count, 1, QTableWidgetItem(size_str))
+                # 大小列
+                size_str = FileUtils.format_size(task.size)
+                self.file_table.setItem(row_count, 1, QTableWidgetItem(size_str))
 
-            # 时间列（使用当前时间）
-            time_str = FileUtils.format_time(int(time.time()))
-            self.file_table.setItem(row_count, 2, QTableWidgetItem(time_str))
+                # 时间列（使用当前时间）
+                time_str = FileUtils.format_time(int(time.time()))
+                self.file_table.setItem(row_count, 2, QTableWidgetItem(time_str))
 
             # 显示通知
             self.status_label.setText(f"文件上传完成: {task.name}")
@@ -1700,11 +1849,11 @@ class MainWindow(QMainWindow):
             self.download_folder(name_item, data['path'])
         else:
             # 文件下载
-            size_item = self.file_table.item(row, 1)
-
-            # 获取文件大小
-            size_text = size_item.text() if size_item else "0"
-            size = self.parse_size(size_text)
+            # 获取文件大小（优先使用列表数据中的字节数，界面上的文本是四舍五入后的值）
+            size = data.get('size')
+            if size is None:
+                size_item = self.file_table.item(row, 1)
+                size = self.parse_size(size_item.text() if size_item else "0")
 
             # 获取文件名
             file_name = name_item.text()
@@ -1739,7 +1888,7 @@ class MainWindow(QMainWindow):
             logger.info(f"文件管理下载按钮: {file_name} -> {save_path}")
 
             # 添加下载任务（指定保存路径）
-            task = self.transfer_page.add_download_task(
+            task = self._ensure_transfer_page().add_download_task(
                 file_name,
                 data['path'],
                 size,
@@ -1751,22 +1900,16 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def parse_size(size_str):
-        """解析文件大小字符串为字节数"""
+        """解析文件大小字符串为字节数（如 "1.5 MB"）"""
         try:
-            size_str = size_str.upper().strip()
-            if 'KB' in size_str:
-                return float(size_str.replace('KB', '')) * 1024
-            elif 'MB' in size_str:
-                return float(size_str.replace('MB', '')) * 1024 * 1024
-            elif 'GB' in size_str:
-                return float(size_str.replace('GB', '')) * 1024 * 1024 * 1024
-            elif 'TB' in size_str:
-                return float(size_str.replace('TB', '')) * 1024 * 1024 * 1024 * 1024
-            elif 'B' in size_str:
-                return float(size_str.replace('B', ''))
-            else:
-                return float(size_str)
-        except:
+            size_str = size_str.strip().upper()
+            # 从末尾向前找到数字部分的结尾，剩下的是单位
+            i = len(size_str)
+            while i and not size_str[i - 1].isdigit() and size_str[i - 1] != '.':
+                i -= 1
+            unit = size_str[i:].strip().rstrip('B')
+            return float(size_str[:i] or 0) * _SIZE_MULT.get(unit, 1)
+        except (ValueError, AttributeError):
             return 0
 
     def create_folder_dialog(self):
@@ -1787,12 +1930,14 @@ class MainWindow(QMainWindow):
                 logger.info("清理第一行的空项")
                 self.file_table.removeRow(0)
 
-        # 在列表顶部插入一个新行
+        # 在列表顶部插入一个新行（新行还没有名字，文件名集合保持不变，供重名检查使用）
+        names = self._get_name_set()
         self.file_table.insertRow(0)
+        self._name_set = names
 
         # 创建文件夹图标项
         icon_item = QTableWidgetItem()
-        icon_item.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
+        icon_item.setIcon(self._standard_icon(QStyle.SP_DirIcon))
         icon_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
         self.file_table.setItem(0, 0, icon_item)
 
@@ -1847,7 +1992,6 @@ class MainWindow(QMainWindow):
         # 创建一个浮动标签作为提示框
         self._tooltip_label = QLabel("⚠️ 文件夹名称不能为空", self)
         self._tooltip_label.setObjectName("tooltipLabel")
-        self._tooltip_label.setStyleSheet(AppStyles.get_stylesheet())
         self._tooltip_label.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
         self._tooltip_label.setAttribute(Qt.WA_TransparentForMouseEvents)
 
@@ -1893,32 +2037,24 @@ class MainWindow(QMainWindow):
 
         logger.info(f"开始创建文件夹: {full_path}")
 
+        # 清除临时item标志，结果回调中删除临时行时不再被当作待编辑项重复处理
+        self._temp_edit_item = None
+
         # 临时禁用表格
         self.file_table.setEnabled(False)
         self.show_status_progress("正在创建文件夹...")
 
-        # 在后台线程中创建
-        from PyQt5.QtCore import QThreadPool, QRunnable
-        import time
-
-        class CreateFolderTask(QRunnable):
-            def __init__(self, api_client, path, callback):
-                super().__init__()
-                self.api_client = api_client
-                self.path = path
-                self.callback = callback
-
-            def run(self):
-                result = self.api_client.create_folder(self.path)
-                self.callback(result)
-
+        # 在共享线程池中创建，结果通过信号回到界面线程处理
         def on_create_complete(result):
             self.hide_status_progress()
             self.file_table.setEnabled(True)
 
             if result:
                 logger.info(f"文件夹创建成功: {folder_name}")
+                self._invalidate_dir_cache(self.current_path)
                 self.status_label.setText(f"文件夹 '{folder_name}' 创建成功")
+                if self._name_set is not None:
+                    self._name_set.add(folder_name)
 
                 # 更新第一行的item为正常文件夹项
                 if self.file_table.rowCount() > 0:
@@ -1935,20 +2071,19 @@ class MainWindow(QMainWindow):
                             'server_mtime': int(time.time())
                         }
 
-                        first_item.setText(folder_name)
-                        first_item.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
-                        first_item.setData(Qt.UserRole, {
-                            'path': folder_data['path'],
-                            'is_dir': folder_data['isdir'],
-                            'fs_id': folder_data['fs_id']
-                        })
-                        first_item.setData(Qt.UserRole + 1, f"路径: {folder_data['path']}")
+                        with self._bulk_table_update():
+                            first_item.setText(folder_name)
+                            first_item.setIcon(self._standard_icon(QStyle.SP_DirIcon))
+                            self._set_row_data(first_item, {
+                                'path': folder_data['path'],
+                                'is_dir': folder_data['isdir'],
+                                'fs_id': folder_data['fs_id']
+                            })
 
-                        self.file_table.setItem(0, 1, QTableWidgetItem(""))
+                            self.file_table.setItem(0, 1, QTableWidgetItem(""))
 
-                        from utils.file_utils import FileUtils
-                        time_str = FileUtils.format_time(folder_data['server_mtime'])
-                        self.file_table.setItem(0, 2, QTableWidgetItem(time_str))
+                            time_str = FileUtils.format_time(folder_data['server_mtime'])
+                            self.file_table.setItem(0, 2, QTableWidgetItem(time_str))
 
                         self.file_table.clearSelection()
 
@@ -1968,10 +2103,16 @@ class MainWindow(QMainWindow):
                 # 显示错误消息
                 QTimer.singleShot(0, lambda: self._show_create_folder_error(folder_name))
 
-            self.current_worker = None
+        def on_create_error(error):
+            logger.error(f"创建文件夹出错: {error}")
+            on_create_complete(False)
 
-        self.current_worker = CreateFolderTask(self.api_client, full_path, on_create_complete)
-        QThreadPool.globalInstance().start(self.current_worker)
+        # 不作为 current_worker：切换目录或刷新时停止当前任务会断开回调，
+        # 创建状态就无法清理，之后再也不能新建文件夹
+        worker = Worker(self.api_client.create_folder, full_path)
+        worker.finished.connect(on_create_complete)
+        worker.error.connect(on_create_error)
+        worker.start()
 
     def eventFilter(self, obj, event):
         """事件过滤器，用于监听按键和点击事件"""
@@ -2148,10 +2289,8 @@ class MainWindow(QMainWindow):
     def _is_valid_folder_name(self, name: str) -> bool:
         """检查文件夹名称是否合法"""
         # Windows 非法字符
-        illegal_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        for char in illegal_chars:
-            if char in name:
-                return False
+        if not _ILLEGAL_NAME_CHARS.isdisjoint(name):
+            return False
         # 检查是否以点开头
         if name.startswith('.'):
             return False
@@ -2160,29 +2299,82 @@ class MainWindow(QMainWindow):
             return False
         return True
 
+    def _init_breadcrumb(self):
+        """创建面包屑中固定的组件
+
+        "位置:"、首页图标和当前目录标签只创建一次；中间的路径按钮和分隔符放在复用池中，
+        导航时只修改文字并显示/隐藏，不再每次删除重建。
+        """
+        layout = self.breadcrumb_layout
+        self._breadcrumb_pool = []  # [(路径按钮, 分隔符)]
+        # 所有路径按钮共用一个映射器，按钮创建时连接一次，导航时只更新映射的目录
+        self._breadcrumb_mapper = QSignalMapper(self)
+        self._breadcrumb_mapper.mapped[str].connect(self.update_items)
+
+        location_label = QLabel("位置:")
+        location_label.setObjectName('locationLabel')
+        layout.addWidget(location_label)
+
+        # 小房子图标（点击返回根目录，位于根目录时禁用）
+        self._breadcrumb_home = ClickableLabel("🏠", lambda: self.update_items("/"))
+        self._breadcrumb_home.setObjectName("breadcrumbHome")
+        layout.addWidget(self._breadcrumb_home)
+
+        self._breadcrumb_current = QLabel()
+        self._breadcrumb_current.setObjectName("breadcrumbCurrent")
+        layout.addWidget(self._breadcrumb_current)
+
+        layout.addStretch()
+
+    def _breadcrumb_slot(self, index):
+        """获取复用池中第 index 组按钮和分隔符，不够时创建"""
+        pool = self._breadcrumb_pool
+        while len(pool) <= index:
+            slot = len(pool)
+            btn = QPushButton()
+            btn.setFlat(True)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setObjectName("breadcrumbRoot" if slot == 0 else "breadcrumbBtn")
+            btn.clicked.connect(self._breadcrumb_mapper.map)
+
+            separator = QLabel(">")
+            separator.setObjectName("breadcrumbSeparator")
+
+            # 插入到"位置:"和首页图标之后、当前目录标签之前
+            position = 2 + slot * 2
+            self.breadcrumb_layout.insertWidget(position, btn)
+            self.breadcrumb_layout.insertWidget(position + 1, separator)
+            pool.append((btn, separator))
+        return pool[index]
+
+    def _show_breadcrumb(self, parts, current_text, home_enabled=True):
+        """
+        显示面包屑
+
+        Args:
+            parts: 可点击的路径部分 [(名称, 完整路径)]
+            current_text: 末尾当前位置的文字
+            home_enabled: 首页图标是否可点击
+        """
+        for index, (name, full_path) in enumerate(parts):
+            btn, separator = self._breadcrumb_slot(index)
+            btn.setText(name)
+            self._breadcrumb_mapper.setMapping(btn, full_path)
+            btn.setVisible(True)
+            separator.setVisible(True)
+
+        # 多余的按钮只隐藏，留给下次复用
+        for btn, separator in self._breadcrumb_pool[len(parts):]:
+            btn.setVisible(False)
+            separator.setVisible(False)
+
+        self._breadcrumb_current.setText(current_text)
+        self._breadcrumb_home.setEnabled(home_enabled)
+        self._breadcrumb_home.setCursor(Qt.PointingHandCursor if home_enabled else Qt.ArrowCursor)
+
     def update_breadcrumb(self, path="/"):
         """更新面包屑导航"""
         try:
-            # 清除现有组件
-            while self.breadcrumb_layout.count():
-                item = self.breadcrumb_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-            location_label = QLabel("位置:")
-            location_label.setObjectName('locationLabel')
-            self.breadcrumb_layout.addWidget(location_label)
-
-            # 添加小房子图标（点击返回根目录）
-            if path == "/":
-                home_label = QLabel("🏠")
-                home_label.setObjectName("breadcrumbHome")
-                home_label.setEnabled(False)
-            else:
-                home_label = ClickableLabel("🏠", lambda: self.update_items("/"))
-                home_label.setObjectName("breadcrumbHome")
-            self.breadcrumb_layout.addWidget(home_label)
-
             # 处理路径
             parts = path.strip('/').split('/')
 
@@ -2190,93 +2382,25 @@ class MainWindow(QMainWindow):
             path_parts = [("根目录", "/")]
             current_path = ""
 
-            for i, part in enumerate(parts):
+            for part in parts:
                 if part:
                     current_path += f"/{part}"
                     path_parts.append((part, current_path))
 
-            # 添加面包屑按钮和标签
-            for i, (name, full_path) in enumerate(path_parts):
-                is_last = (i == len(path_parts) - 1)
-                if is_last:
-                    self.current_path = full_path
-                    last_label = QLabel(name)
-                    last_label.setObjectName("breadcrumbCurrent")
-                    self.breadcrumb_layout.addWidget(last_label)
-                else:
-                    btn = QPushButton(name)
-                    btn.setFlat(True)
-                    btn.setCursor(Qt.PointingHandCursor)
-
-                    if i == 0:
-                        btn.setObjectName("breadcrumbRoot")
-                    else:
-                        btn.setObjectName("breadcrumbBtn")
-
-                    btn.clicked.connect(lambda checked, p=full_path: self.update_items(p))
-                    self.breadcrumb_layout.addWidget(btn)
-
-                if i < len(path_parts) - 1:
-                    separator = QLabel(">")
-                    separator.setObjectName("breadcrumbSeparator")
-                    self.breadcrumb_layout.addWidget(separator)
-
-            self.breadcrumb_layout.addStretch()
+            # 最后一级显示为当前位置，其余为可点击的按钮
+            name, self.current_path = path_parts[-1]
+            self._show_breadcrumb(path_parts[:-1], name, home_enabled=(path != "/"))
 
         except Exception as e:
             logger.error(f"更新面包屑时出错: {e}")
-            error_label = QLabel(f"位置: {path}")
-            error_label.setObjectName("locationLabel")
-            self.breadcrumb_layout.addWidget(error_label)
-            self.breadcrumb_layout.addStretch()
 
     def update_search_breadcrumb(self, keyword: str, result_count: str = ""):
         """更新搜索面包屑导航"""
         try:
             logger.info(f"[搜索面包屑] 更新搜索面包屑: keyword={keyword}, count={result_count}")
 
-            # 清除现有组件（不使用deleteLater，直接移除）
-            while self.breadcrumb_layout.count():
-                item = self.breadcrumb_layout.takeAt(0)
-                if item:
-                    widget = item.widget()
-                    if widget:
-                        widget.setParent(None)
-
-            # 直接添加新组件
-            # 位置: 标签
-            location_label = QLabel("位置:")
-            location_label.setObjectName('locationLabel')
-            self.breadcrumb_layout.addWidget(location_label)
-
-            # 添加小房子图标（可点击返回根目录）
-            home_label = ClickableLabel("🏠", lambda: self.update_items("/"))
-            home_label.setObjectName("breadcrumbHome")
-            self.breadcrumb_layout.addWidget(home_label)
-
-            # 添加根目录按钮（可点击返回根目录）
-            root_btn = QPushButton("根目录")
-            root_btn.setFlat(True)
-            root_btn.setCursor(Qt.PointingHandCursor)
-            root_btn.setObjectName("breadcrumbRoot")
-            root_btn.clicked.connect(lambda: self.update_items("/"))
-            self.breadcrumb_layout.addWidget(root_btn)
-
-            # 添加分隔符
-            separator = QLabel(">")
-            separator.setObjectName("breadcrumbSeparator")
-            self.breadcrumb_layout.addWidget(separator)
-
-            # 添加搜索关键词标签
-            search_label = QLabel(f"{keyword}(搜索){result_count}")
-            search_label.setObjectName("breadcrumbCurrent")
-            self.breadcrumb_layout.addWidget(search_label)
-
-            self.breadcrumb_layout.addStretch()
-
-            # 强制更新UI
-            self.breadcrumb_widget.update()
-            self.breadcrumb_layout.update()
+            # 根目录按钮（可点击返回根目录） > 搜索关键词
+            self._show_breadcrumb([("根目录", "/")], f"{keyword}(搜索){result_count}")
             self.breadcrumb_widget.show()
 
             logger.info(f"[搜索面包屑] 面包屑更新完成，组件数量: {self.breadcrumb_layout.count()}")
@@ -2286,14 +2410,45 @@ class MainWindow(QMainWindow):
             import traceback
             logger.error(traceback.format_exc())
 
-    def update_items(self, path):
-        """更新items"""
+    def update_items(self, path, force=False):
+        """
+        更新items
+
+        第一次请求立即执行；120ms 内的后续请求（如连按 F5）合并为最后一次，
+        在间隔结束后再执行。
+
+        Args:
+            path: 目录路径
+            force: 用户手动刷新，丢弃该目录的缓存并从服务器重新加载
+        """
+        if self._update_items_timer.isActive():
+            if self._pending_update and self._pending_update[0] == path:
+                force = force or self._pending_update[1]
+            self._pending_update = (path, force)
+            self._update_items_timer.start()
+            return
+
+        self._update_items_timer.start()
+        self._do_update_items(path, force)
+
+    def _flush_pending_update(self):
+        """执行防抖期间最后一次目录加载请求"""
+        pending, self._pending_update = self._pending_update, None
+        if pending:
+            self._do_update_items(*pending)
+
+    def _do_update_items(self, path, force=False):
+        """加载目录（由 update_items 调用）"""
         if not self.api_client:
             return
 
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        # 切换到其他目录时优先使用缓存；重新加载当前目录时总是请求服务器
+        if force:
+            self.dir_cache.invalidate(self.current_account, path)
+        elif path != self.current_path and self._show_cached_directory(path):
+            return
+
+        self._stop_current_worker()
 
         # 设置加载标志
         self.is_loading_files = True
@@ -2307,9 +2462,12 @@ class MainWindow(QMainWindow):
         self._set_transfer_buttons_enabled(False)
 
         self.current_worker = Worker(
-            func=self.api_client.list_files,
-            path=path
+            func=_list_files_for_table,
+            api_client=self.api_client,
+            path=path,
+            limit=FileConstants.LIST_PAGE_SIZE
         )
+        self.current_worker.finished.connect(functools.partial(self._store_dir_cache, path))
         self.current_worker.finished.connect(self.on_directory_success)
         self.current_worker.error.connect(self.on_directory_load_error)
         self.current_worker.start()
@@ -2327,7 +2485,8 @@ class MainWindow(QMainWindow):
         # 更新表头显示
         self.update_header_labels()
 
-        # 本地对已加载的数据进行排序
+        # 本地对已加载的数据进行排序，之后加载的分页也要重新排序
+        self._sorted_locally = True
         self.sort_and_display_files()
 
     def sort_and_display_files(self):
@@ -2358,7 +2517,6 @@ class MainWindow(QMainWindow):
         sorted_list = sorted(self.current_file_list, key=get_sort_key, reverse=reverse)
 
         # 重新显示
-        self.file_table.setRowCount(0)
         self.set_list_items(sorted_list)
 
     def update_header_labels(self):
@@ -2376,7 +2534,7 @@ class MainWindow(QMainWindow):
         """显示搜索错误提示（泡泡提醒）"""
         # 在搜索提示标签显示错误
         self.search_hint_label.setText(f"❌ {message}")
-        self.search_hint_label.setStyleSheet("color: #e74c3c; font-size: 11px; background: #fadbd8; padding: 3px 8px; border-radius: 3px;")
+        self.search_hint_label.setStyleSheet(_SEARCH_HINT_ERROR_QSS)
         self.search_hint_label.show()
 
         # duration 毫秒后自动隐藏
@@ -2385,35 +2543,17 @@ class MainWindow(QMainWindow):
     def _on_search_input_changed(self, text: str):
         """搜索框文本变化时的处理"""
         char_count = len(text)
-        if char_count > 30:
-            # 显示红色边框
-            self.search_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 5px 10px;
-                    border: 1px solid #e74c3c;
-                    border-radius: 4px;
-                    background: white;
-                }
-                QLineEdit:focus {
-                    border: 1px solid #e74c3c;
-                }
-            """)
+        over_limit = char_count > 30
+        # 只在超限状态切换时重设样式，避免每次输入都重新解析样式表
+        if over_limit != self._search_over_limit:
+            self._search_over_limit = over_limit
+            self.search_input.setStyleSheet(_SEARCH_INPUT_OVER_LIMIT_QSS if over_limit else _SEARCH_INPUT_QSS)
+
+        if over_limit:
             # 显示提示文字
             self.search_hint_label.setText(f"⚠️ 已超限 {char_count}/30 字符")
             self.search_hint_label.show()
         else:
-            # 恢复正常样式
-            self.search_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 5px 10px;
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    background: white;
-                }
-                QLineEdit:focus {
-                    border: 1px solid #4A90E2;
-                }
-            """)
             # 隐藏提示文字
             self.search_hint_label.hide()
 
@@ -2437,9 +2577,7 @@ class MainWindow(QMainWindow):
         logger.info(f"[搜索] 开始搜索: keyword={keyword}, category={category}, page={page}, path={self.current_path}")
 
         # 如果有正在运行的Worker，先停止
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        self._stop_current_worker()
 
         # 显示进度
         self.is_loading_files = True
@@ -2456,9 +2594,9 @@ class MainWindow(QMainWindow):
                 if result and result.get('errno') == 0:
                     file_list = result.get('list', [])
                     self.current_file_list = file_list  # 保存搜索结果
+                    self._has_more_files = False
                     logger.info(f"[搜索] 搜索成功，找到 {len(file_list)} 个结果")
 
-                    self.file_table.setRowCount(0)
                     self.set_list_items(file_list)
                     self.file_table.setEnabled(True)
 
@@ -2485,7 +2623,7 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "搜索失败", f"搜索失败：{error_msg}")
                     self.file_table.setEnabled(True)
 
-                self.current_worker = None
+                self._retire_worker(self.current_worker)
                 self._set_transfer_buttons_enabled(True)
             except Exception as e:
                 logger.error(f"[搜索] 回调处理异常: {e}")
@@ -2537,9 +2675,9 @@ class MainWindow(QMainWindow):
                     file_list = all_files
 
                 self.current_file_list = file_list  # 保存搜索结果
+                self._has_more_files = False
                 logger.info(f"[搜索] 搜索成功，找到 {len(file_list)} 个结果")
 
-                self.file_table.setRowCount(0)
                 self.set_list_items(file_list)
                 self.file_table.setEnabled(True)
 
@@ -2565,7 +2703,7 @@ class MainWindow(QMainWindow):
                 self.show_search_error(f"搜索失败：{error_msg}")
                 self.file_table.setEnabled(True)
 
-            self.current_worker = None
+            self._retire_worker(self.current_worker)
             self._set_transfer_buttons_enabled(True)
 
         # 启动搜索线程
@@ -2617,7 +2755,7 @@ class MainWindow(QMainWindow):
                 menu.addAction("📋 粘贴 (Ctrl+V)", self.paste_files)
 
             menu.addSeparator()
-            menu.addAction("🔄 刷新", lambda: self.update_items(self.current_path))
+            menu.addAction("🔄 刷新", self.refresh_current_dir)
             menu.addAction("✓ 全选", self.file_table.selectAll)
 
         menu.exec_(self.file_table.viewport().mapToGlobal(position))
@@ -2627,6 +2765,7 @@ class MainWindow(QMainWindow):
         try:
             dialog = FilePropertiesDialog(file_data, self)
             dialog.exec_()
+            dialog.deleteLater()
         except Exception as e:
             logger.error(f"显示文件属性失败: {e}")
             import traceback
@@ -2634,8 +2773,7 @@ class MainWindow(QMainWindow):
 
     def copy_item_text(self, text):
         """复制文本"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        self._clipboard.setText(text)
         self.status_label.setText(f"已复制: {text[:30]}...")
 
     def rename_file(self, item=None):
@@ -2646,6 +2784,8 @@ class MainWindow(QMainWindow):
 
         self.renaming_item = item
         self.original_text = item.text()
+        # 在编辑前建立文件名集合，提交时用于查重
+        self._get_name_set()
 
         # 分离文件名和扩展名（只记录信息，不修改显示）
         text = item.text()
@@ -2675,6 +2815,10 @@ class MainWindow(QMainWindow):
 
     def on_item_changed(self, item):
         """处理单元格内容变化"""
+        # 批量填充表格时的变化不是用户编辑
+        if self._populating:
+            return
+
         # 处理新建文件夹的情况
         if getattr(self, 'creating_folder', False) and item.row() == 0 and item.column() == 0:
             # 保存原始文本，用于判断是否真的有输入
@@ -2708,18 +2852,17 @@ class MainWindow(QMainWindow):
                 self.status_label.setText("文件夹名称无效")
                 return
 
-            # 检查是否已存在同名文件/文件夹
-            for row_idx in range(self.file_table.rowCount()):
-                if row_idx == 0:  # 跳过正在编辑的行
-                    continue
-                existing_item = self.file_table.item(row_idx, 0)
-                if existing_item and existing_item.text() == folder_name:
-                    logger.warning(f"文件夹已存在: '{folder_name}'")
-                    QMessageBox.warning(self, "提示", f"已存在名为 '{folder_name}' 的文件或文件夹")
-                    self.file_table.removeRow(0)
-                    self._cleanup_folder_creation()
-                    self.status_label.setText("取消创建文件夹")
-                    return
+            # 检查是否已存在同名文件/文件夹（编辑期间行有增删时重新收集，跳过正在编辑的第一行）
+            names = self._name_set
+            if names is None:
+                names = self._collect_names(start_row=1)
+            if folder_name in names:
+                logger.warning(f"文件夹已存在: '{folder_name}'")
+                QMessageBox.warning(self, "提示", f"已存在名为 '{folder_name}' 的文件或文件夹")
+                self.file_table.removeRow(0)
+                self._cleanup_folder_creation()
+                self.status_label.setText("取消创建文件夹")
+                return
 
             # 创建文件夹
             # 先清除临时item标志，防止 _handle_click_outside 重复处理
@@ -2737,27 +2880,17 @@ class MainWindow(QMainWindow):
             self.file_table.setEnabled(False)
             self.show_status_progress("正在创建文件夹...")
 
-            # 在后台线程中创建
-            from PyQt5.QtCore import QThreadPool, QRunnable
-
-            class CreateFolderTask(QRunnable):
-                def __init__(self, api_client, path, callback):
-                    super().__init__()
-                    self.api_client = api_client
-                    self.path = path
-                    self.callback = callback
-
-                def run(self):
-                    result = self.api_client.create_folder(self.path)
-                    self.callback(result)
-
+            # 在共享线程池中创建，结果通过信号回到界面线程处理
             def on_create_complete(result):
                 self.hide_status_progress()
                 self.file_table.setEnabled(True)
 
                 if result:
                     logger.info(f"文件夹创建成功: {folder_name}")
+                    self._invalidate_dir_cache(self.current_path)
                     self.status_label.setText(f"文件夹 '{folder_name}' 创建成功")
+                    if self._name_set is not None:
+                        self._name_set.add(folder_name)
 
                     # 直接更新第一行的item，将其转换为正常的文件夹项
                     if self.file_table.rowCount() > 0:
@@ -2775,23 +2908,22 @@ class MainWindow(QMainWindow):
                                 'server_mtime': int(time.time())
                             }
 
-                            # 更新第一行
-                            first_item.setText(folder_name)
-                            first_item.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
-                            first_item.setData(Qt.UserRole, {
-                                'path': folder_data['path'],
-                                'is_dir': folder_data['isdir'],
-                                'fs_id': folder_data['fs_id']
-                            })
-                            first_item.setData(Qt.UserRole + 1, f"路径: {folder_data['path']}")
+                            with self._bulk_table_update():
+                                # 更新第一行
+                                first_item.setText(folder_name)
+                                first_item.setIcon(self._standard_icon(QStyle.SP_DirIcon))
+                                self._set_row_data(first_item, {
+                                    'path': folder_data['path'],
+                                    'is_dir': folder_data['isdir'],
+                                    'fs_id': folder_data['fs_id']
+                                })
 
-                            # 设置大小列为空（文件夹不显示大小）
-                            self.file_table.setItem(0, 1, QTableWidgetItem(""))
+                                # 设置大小列为空（文件夹不显示大小）
+                                self.file_table.setItem(0, 1, QTableWidgetItem(""))
 
-                            # 设置修改时间为当前时间
-                            from utils.file_utils import FileUtils
-                            time_str = FileUtils.format_time(folder_data['server_mtime'])
-                            self.file_table.setItem(0, 2, QTableWidgetItem(time_str))
+                                # 设置修改时间为当前时间
+                                time_str = FileUtils.format_time(folder_data['server_mtime'])
+                                self.file_table.setItem(0, 2, QTableWidgetItem(time_str))
 
                             # 取消选中状态
                             self.file_table.clearSelection()
@@ -2813,9 +2945,15 @@ class MainWindow(QMainWindow):
                     # 使用 QTimer 延迟显示消息框，避免在回调中直接显示
                     QTimer.singleShot(0, lambda: self._show_create_folder_error(folder_name))
 
+            def on_create_error(error):
+                logger.error(f"创建文件夹出错: {error}")
+                on_create_complete(False)
+
             # 创建并启动任务
-            task = CreateFolderTask(self.api_client, full_path, on_create_complete)
-            QThreadPool.globalInstance().start(task)
+            worker = Worker(self.api_client.create_folder, full_path)
+            worker.finished.connect(on_create_complete)
+            worker.error.connect(on_create_error)
+            worker.start()
             return
 
         # 原有的重命名逻辑
@@ -2841,20 +2979,17 @@ class MainWindow(QMainWindow):
         # 保存完整的新文件名，供后续使用
         self.full_new_name = full_new_name
 
-        values = []
-        for i in range(self.file_table.rowCount()):
-            if i == item.row():
-                continue
-            current_item = self.file_table.item(i, 0)
-            if not current_item:
-                continue
-            values.append(current_item.text().strip())
-
-        if full_new_name in values:
+        # 编辑期间行有增删时集合已失效，重建时跳过正在编辑的行（其中已是新名字）
+        names = self._name_set
+        if names is None:
+            names = self._collect_names(skip_row=item.row())
+        if full_new_name in names:
             item_obj = self.file_table.item(item.row(), item.column())
             rect = self.file_table.visualItemRect(item_obj)
             global_pos = self.file_table.viewport().mapToGlobal(rect.topLeft())
-            QTimer.singleShot(100, lambda: self.show_tooltip(
+            # 下一次事件循环时显示（等编辑器关闭），不再额外等待 100ms
+            QTimer.singleShot(0, functools.partial(
+                QToolTip.showText,
                 global_pos, f'"{full_new_name}" 已存在',
                 self.file_table,
                 self.file_table.visualRect(self.file_table.indexFromItem(item))
@@ -2880,9 +3015,7 @@ class MainWindow(QMainWindow):
         # 禁用传输页面的所有按钮
         self._set_transfer_buttons_enabled(False)
 
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        self._stop_current_worker()
 
         self.current_worker = Worker(
             func=self.api_client.batch_operation,
@@ -2906,10 +3039,16 @@ class MainWindow(QMainWindow):
 
     def on_rename_success(self, result):
         # 重命名成功，直接在本地更新，不需要重新获取列表
+        self._invalidate_dir_cache(self.current_path)
+
         if self.renaming_item:
             # 使用保存的完整文件名（从 on_item_changed 中保存的）
             full_new_name = getattr(self, 'full_new_name', self.renaming_item.text().strip())
 
+            if self._name_set is not None:
+                self._name_set.discard(self.original_text)
+                self._name_set.add(full_new_name)
+
             # 保存引用，避免在延迟回调中访问已清空的变量
             item_to_update = self.renaming_item
 
@@ -2919,7 +3058,7 @@ class MainWindow(QMainWindow):
         self.renaming_item = self.original_text = None
         self.file_table.setEnabled(True)
         self.status_label.setText(f"已成功重命名")
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         # 清除操作进行中标志
         self.is_operation_in_progress = False
         # 隐藏进度条
@@ -2943,7 +3082,7 @@ class MainWindow(QMainWindow):
                     parent_dir, old_name = path_parts
                     new_path = f"{parent_dir}/{full_new_name}"
                     data['path'] = new_path
-                    item.setData(Qt.UserRole, data)
+                    self._set_row_data(item, data)
 
     def on_rename_error(self, error_msg):
         # 重命名失败，延迟恢复原始文件名
@@ -2961,16 +3100,12 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(0, lambda: item_to_restore.setText(original_text))
 
         QMessageBox.critical(self, "错误", f"改名失败：{error_msg}")
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         # 清除操作进行中标志
         self.is_operation_in_progress = False
         # 隐藏进度条
         self.hide_status_progress()
 
-    def show_tooltip(self, pos: QPoint, text: str, p_str: Optional[QWidget], rect: QRect):
-        """显示工具提示"""
-        QToolTip.showText(pos, text, p_str, rect)
-
     def delete_file(self, data=None):
         """删除文件（支持批量删除）"""
         selected_items = self.file_table.selectedItems()
@@ -3014,9 +3149,12 @@ class MainWindow(QMainWindow):
         msg_box.setDefaultButton(yes_btn)
 
         msg_box.exec_()
+        confirmed = msg_box.clickedButton() == yes_btn
+        # 对话框以主窗口为父对象，关闭后及时释放
+        msg_box.deleteLater()
 
         # 检查点击的按钮
-        if msg_box.clickedButton() == yes_btn:
+        if confirmed:
             # 保存要删除的行号和文件列表
             self.rows_to_delete = rows_to_delete
             self.file_count_to_delete = file_count
@@ -3035,9 +3173,7 @@ class MainWindow(QMainWindow):
             file_paths = [f['path'] for f in file_list]
 
             # 使用 Worker 异步删除
-            if self.current_worker and self.current_worker.isRunning():
-                self.current_worker.stop()
-                self.current_worker.wait()
+            self._stop_current_worker()
 
             self.current_worker = Worker(
                 func=self.api_client.delete_files,
@@ -3049,10 +3185,13 @@ class MainWindow(QMainWindow):
 
     def on_delete_success(self, result):
         """删除成功回调"""
+        self._invalidate_dir_cache(self.current_path)
+
         # 从表格中删除所有选中的行（从后往前删除，避免行号变化）
         if hasattr(self, 'rows_to_delete'):
-            for row in sorted(self.rows_to_delete, reverse=True):
-                self.file_table.removeRow(row)
+            with self._bulk_table_update() as table:
+                for row in sorted(self.rows_to_delete, reverse=True):
+                    table.removeRow(row)
 
             file_count = getattr(self, 'file_count_to_delete', 0)
             self.status_label.setText(f"已删除 {file_count} 个项目")
@@ -3065,7 +3204,7 @@ class MainWindow(QMainWindow):
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
         self.hide_status_progress()
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         # 重新启用传输页面的所有按钮
         self._set_transfer_buttons_enabled(True)
 
@@ -3083,7 +3222,7 @@ class MainWindow(QMainWindow):
         self.file_table.setEnabled(True)
         self.is_operation_in_progress = False
         self.hide_status_progress()
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         # 重新启用传输页面的所有按钮
         self._set_transfer_buttons_enabled(True)
 
@@ -3150,7 +3289,6 @@ class MainWindow(QMainWindow):
 
     def _format_size(self, size_bytes):
         """格式化文件大小"""
-        from utils.file_utils import FileUtils
         return FileUtils.format_size(size_bytes)
 
     def _set_all_buttons_enabled(self, enabled):
@@ -3221,9 +3359,11 @@ class MainWindow(QMainWindow):
         if not data:
             return
 
-        size_item = self.file_table.item(item.row(), 1)
-        size_text = size_item.text() if size_item else "0"
-        size = self.parse_size(size_text)
+        # 优先使用列表数据中的字节数，界面上的文本是四舍五入后的值
+        size = data.get('size')
+        if size is None:
+            size_item = self.file_table.item(item.row(), 1)
+            size = self.parse_size(size_item.text() if size_item else "0")
 
         # 获取文件名
         file_name = item.text()
@@ -3262,82 +3402,171 @@ class MainWindow(QMainWindow):
         logger.info(f"=" * 50)
 
         # 添加下载任务（指定保存路径）
-        task = self.transfer_page.add_download_task(file_name, path, size, save_path)
+        task = self._ensure_transfer_page().add_download_task(file_name, path, size, save_path)
 
         item_obj = self.file_table.item(item.row(), item.column())
         rect = self.file_table.visualItemRect(item_obj)
         global_pos = self.file_table.viewport().mapToGlobal(rect.topLeft())
-        QTimer.singleShot(100, lambda: self.show_tooltip(global_pos, f"已添加下载任务: {file_name}", self, rect))
+        QTimer.singleShot(0, functools.partial(QToolTip.showText, global_pos, f"已添加下载任务: {file_name}", self, rect))
 
     def get_file_type_icon(self, filename, is_dir=False):
-        """根据文件名和类型获取对应的图标"""
+        """根据文件名和类型获取对应的图标（同类图标共用一个 QIcon）"""
         if is_dir:
-            return self.style().standardIcon(QStyle.SP_DirIcon)
-
-        _, ext = os.path.splitext(filename.lower())
-
-        # 使用 QStyle 标准图标区分不同类型
-        # 图片 - SP_DialogOpenButton
-        # 音频 - SP_MediaVolume
-        # 视频 - SP_MediaPlay
-        # 文档 - SP_FileIcon
-        # 压缩包 - SP_DriveCDIcon
-
-        image_exts = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'}
-        audio_exts = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'}
-        video_exts = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.rmvb'}
-        archive_exts = {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'}
-        doc_exts = {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'}
-
-        if ext in image_exts:
-            return self.style().standardIcon(QStyle.SP_DialogOpenButton)
-        elif ext in audio_exts:
-            return self.style().standardIcon(QStyle.SP_MediaVolume)
-        elif ext in video_exts:
-            return self.style().standardIcon(QStyle.SP_MediaPlay)
-        elif ext in archive_exts:
-            return self.style().standardIcon(QStyle.SP_DriveCDIcon)
-        elif ext in doc_exts:
-            return self.style().standardIcon(QStyle.SP_FileIcon)
+            icon_type = QStyle.SP_DirIcon
         else:
-            return self.style().standardIcon(QStyle.SP_FileIcon)
+            _, ext = os.path.splitext(filename.lower())
+            icon_type = _EXT_ICON_TYPES.get(ext, QStyle.SP_FileIcon)
+        return self._standard_icon(icon_type)
+
+    def _standard_icon(self, icon_type):
+        """获取缓存的 QStyle 标准图标（每种图标只向样式请求一次）"""
+        icon = self._file_icons.get(icon_type)
+        if icon is None:
+            icon = self._file_icons[icon_type] = self.style().standardIcon(icon_type)
+        return icon
+
+    @staticmethod
+    def _set_row_data(item, data):
+        """保存表格行数据到 Qt.UserRole（按引用保存，不转换为 QVariantMap）"""
+        item.setData(Qt.UserRole, data if isinstance(data, _RowData) else _RowData(data))
 
     # 设置表格项目
     def set_list_items(self, files):
-        self.file_table.setRowCount(len(files))
-        for row, file in enumerate(files):
-            try:
-                # 安全获取文件名，如果不存在则使用默认值
-                server_filename = file.get('server_filename', '未知文件')
-                name_item = QTableWidgetItem(server_filename)
+        with self._bulk_table_update() as table:
+            # 已有的表格项在 _fill_list_items 中直接复用，只有正在编辑时才全部清空，
+            # 避免编辑器停留在被复用的项上
+            if table.state() == QAbstractItemView.EditingState:
+                table.clearContents()
+            table.setRowCount(len(files))
+            self._fill_list_items(files)
+        self._name_set = {file.get('server_filename', '未知文件') for file in files}
+
+    def _invalidate_name_set(self, *args):
+        """表格行发生增删，文件名集合需要重建"""
+        self._name_set = None
+
+    def _get_name_set(self):
+        """
+        获取当前表格中的文件名集合
 
-                # 安全获取路径和目录标识
-                path = file.get('path', '')
-                isdir = file.get('isdir', 0)
-                fs_id = file.get('fs_id', '')
+        Returns:
+            set: 文件名集合（已失效时从表格第一列重建）
+        """
+        if self._name_set is None:
+            self._name_set = self._collect_names()
+        return self._name_set
 
-                # 直接保存完整的文件信息到 UserRole
-                name_item.setData(Qt.UserRole, file)
+    def _collect_names(self, start_row=0, skip_row=None):
+        """
+        从表格第一列收集文件名
 
-                tooltip_text = f"路径: {path}"
-                if not isdir:
-                    size = file.get('size', 0)
-                    tooltip_text += f"\n大小: {FileUtils.format_size(size)}"
-                name_item.setData(Qt.UserRole + 1, tooltip_text)
+        Args:
+            start_row: 从第几行开始收集
+            skip_row: 跳过的行（如正在编辑的行，其中已经是新名字）
 
-                # 设置文件类型图标
-                icon = self.get_file_type_icon(server_filename, isdir)
-                name_item.setIcon(icon)
+        Returns:
+            set: 文件名集合
+        """
+        table = self.file_table
+        names = set()
+        for row in range(start_row, table.rowCount()):
+            if row == skip_row:
+                continue
+            item = table.item(row, 0)
+            if item:
+                names.add(item.text().strip())
+        return names
 
-                self.file_table.setItem(row, 0, name_item)
+    @contextmanager
+    def _bulk_table_update(self):
+        """批量更新文件表格
+
+        期间关闭重绘、信号和排序，结束后（包括出现异常时）恢复并只重绘一次。
+        """
+        table = self.file_table
+        sorting_enabled = table.isSortingEnabled()
+        populating = self._populating
+        self._populating = True
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                yield table
+        finally:
+            self._populating = populating
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def _fill_list_items(self, files, start_row=0):
+        """填充表格行（由 set_list_items 在批量更新状态下调用）
+
+        Args:
+            files: 文件列表
+            start_row: 从第几行开始填充（追加分页时使用）
+        """
+        # 预先计算大小和时间文本，循环中只创建表格项
+        format_size = FileUtils.format_size
+        format_time = FileUtils.format_time
+        size_texts = [
+            "" if file.get('isdir') else format_size(file.get('size') or 0)
+            for file in files
+        ]
+        time_texts = [format_time(file.get('local_mtime', 0)) for file in files]
+
+        # 循环内用到的方法和常量先绑定到局部变量，减少每行的属性查找
+        table = self.file_table
+        get_item = table.item
+        set_item = table.setItem
+        get_icon = self.get_file_type_icon
+        new_item = QTableWidgetItem
+        row_data = _RowData
+        user_role = Qt.UserRole
+        foreground_role = Qt.ForegroundRole
+        default_flags = new_item().flags()
+
+        for index, file in enumerate(files):
+            row = start_row + index
+            try:
+                # 安全获取文件名，如果不存在则使用默认值
+                server_filename = file.get('server_filename', '未知文件')
+                icon = get_icon(server_filename, file.get('isdir'))
 
-                size = file.get('size', 0)
-                size_str = FileUtils.format_size(size) if not isdir else ""
-                self.file_table.setItem(row, 1, QTableWidgetItem(size_str))
+                # 上一次列表留下的表格项直接改写内容，只有新增的行才创建表格项
+                name_item = get_item(row, 0)
+                if name_item is None:
+                    name_item = new_item(server_filename)
+                    set_item(row, 0, name_item)
+                else:
+                    name_item.setText(server_filename)
+                    # 新建文件夹的编辑行修改过标志位，复用时恢复默认
+                    if name_item.flags() != default_flags:
+                        name_item.setFlags(default_flags)
+                    # 清除剪切状态留下的灰色前景色，需要时由 _refresh_cut_visual_state 重新设置
+                    if name_item.data(foreground_role) is not None:
+                        name_item.setData(foreground_role, None)
+
+                # 直接保存完整的文件信息到 UserRole（路径、大小等都从这里读取，不再额外保存提示文本）
+                name_item.setData(user_role, row_data(file))
+
+                # 设置文件类型图标（同类文件共用缓存的图标）
+                name_item.setIcon(icon)
 
-                mtime = file.get('local_mtime', 0)
-                time_str = FileUtils.format_time(mtime)
-                self.file_table.setItem(row, 2, QTableWidgetItem(time_str))
+                size_item = get_item(row, 1)
+                if size_item is None:
+                    set_item(row, 1, new_item(size_texts[index]))
+                else:
+                    size_item.setText(size_texts[index])
+                    if size_item.data(foreground_role) is not None:
+                        size_item.setData(foreground_role, None)
+
+                time_item = get_item(row, 2)
+                if time_item is None:
+                    set_item(row, 2, new_item(time_texts[index]))
+                else:
+                    time_item.setText(time_texts[index])
+                    if time_item.data(foreground_role) is not None:
+                        time_item.setData(foreground_role, None)
 
             except Exception as e:
                 logger.error(f"设置文件列表项失败 (row={row}, file={file}): {e}")
@@ -3347,6 +3576,12 @@ class MainWindow(QMainWindow):
                 continue
 
     def on_table_double_clicked(self, row):
+        # 过滤过快的重复双击，避免连续启动多个加载任务
+        now = time.monotonic()
+        if now - self._last_double_click_time < 0.15:
+            return
+        self._last_double_click_time = now
+
         try:
             item = self.file_table.item(row, 0)
             if not item:
@@ -3411,9 +3646,10 @@ class MainWindow(QMainWindow):
                 logger.warning(f"行 {row} 的路径为空")
                 return
 
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+        if self._show_cached_directory(path):
+            return
+
+        self._stop_current_worker()
 
         # 设置加载标志
         self.is_loading_files = True
@@ -3424,26 +3660,185 @@ class MainWindow(QMainWindow):
         self.update_breadcrumb(path)
 
         self.current_worker = Worker(
-            func=self.api_client.list_files,
-            path=path
+            func=_list_files_for_table,
+            api_client=self.api_client,
+            path=path,
+            limit=FileConstants.LIST_PAGE_SIZE
         )
+        self.current_worker.finished.connect(functools.partial(self._store_dir_cache, path))
         self.current_worker.finished.connect(self.on_directory_success)
         self.current_worker.error.connect(self.on_directory_load_error)
         self.current_worker.start()
 
+    def _show_cached_directory(self, path: str) -> bool:
+        """
+        使用缓存显示目录
+
+        Args:
+            path: 目录路径
+
+        Returns:
+            bool: 缓存命中并已显示返回 True
+        """
+        cached = self.dir_cache.get(self.current_account, path)
+        if cached is None:
+            return False
+
+        logger.info(f"使用缓存的目录列表: {path}")
+        self._stop_current_worker()
+        self.current_path = path
+        self.update_breadcrumb(path)
+        self.on_directory_success(cached)
+        return True
+
+    def _reset_file_paging(self, files):
+        """记录新加载的目录内容，并根据数量判断是否还有下一页"""
+        self.current_file_list = files
+        self._sorted_locally = False
+        # 上一个列表还在加载的下一页已经过期
+        self._retire_worker(self._more_files_worker)
+        self._more_files_worker = None
+        page_size = FileConstants.LIST_PAGE_SIZE
+        # 缓存中保存的是已加载的全部分页，数量为整页时说明可能还有下一页
+        self._has_more_files = bool(files) and len(files) % page_size == 0
+
+    def _on_file_table_scrolled(self, value):
+        """表格滚动到底部附近时加载下一页"""
+        if not self._has_more_files or self.is_loading_files:
+            return
+        if self._more_files_worker and self._more_files_worker.isRunning():
+            return
+        scrollbar = self.file_table.verticalScrollBar()
+        if scrollbar.maximum() - value > scrollbar.pageStep():
+            return
+        self._fetch_more_files()
+
+    def _fetch_more_files(self):
+        """后台加载当前目录的下一页"""
+        if not self.api_client:
+            return
+        path = self.current_path
+        start = len(self.current_file_list)
+        self.status_label.setText(f"正在加载更多: 已加载 {start} 个项目")
+
+        self._retire_worker(self._more_files_worker)
+        worker = Worker(
+            func=_list_files_for_table,
+            api_client=self.api_client,
+            path=path,
+            start=start,
+            limit=FileConstants.LIST_PAGE_SIZE
+        )
+        worker.finished.connect(functools.partial(self._on_more_files_loaded, path, start))
+        worker.error.connect(lambda e: logger.error(f"加载下一页失败: {e}"))
+        self._more_files_worker = worker
+        worker.start()
+
+    def _on_more_files_loaded(self, path, start, result):
+        """
+        下一页加载完成，追加到表格末尾
+
+        Args:
+            path: 请求时的目录
+            start: 请求时的起始位置
+            result: 本页文件列表
+        """
+        # 期间已切换目录或重新加载，丢弃过期结果
+        if path != self.current_path or start != len(self.current_file_list):
+            return
+
+        result = result or []
+        self._has_more_files = len(result) == FileConstants.LIST_PAGE_SIZE
+        if not result:
+            return
+
+        self.current_file_list = self.current_file_list + result
+        self.dir_cache.put(self.current_account, path, self.current_file_list)
+
+        if self._sorted_locally:
+            # 已按表头排序时整体重新排序，新分页不直接追加在末尾
+            self.sort_and_display_files()
+        else:
+            with self._bulk_table_update() as table:
+                table.setRowCount(start + len(result))
+                self._fill_list_items(result, start_row=start)
+
+        self.status_label.setText(f"已加载 {len(self.current_file_list)} 个项目")
+        self._refresh_cut_visual_state()
+
+    def _store_dir_cache(self, path: str, result):
+        """目录加载成功后写入缓存，并预取子目录"""
+        # 请求失败时 list_files 也返回空列表，空结果不缓存，避免把失败结果保留下来
+        if isinstance(result, list) and result:
+            self.dir_cache.put(self.current_account, path, result)
+            self._prefetch_subdirectories(result)
+
+    def _prefetch_subdirectories(self, files):
+        """
+        在后台预取子目录列表，用户进入子目录时可直接使用缓存
+
+        Args:
+            files: 刚加载完成的目录内容
+        """
+        # 切换目录后，之前排队中的预取任务不再需要
+        for worker in self._prefetch_workers:
+            worker.stop()
+        self._prefetch_workers = []
+
+        if not self.api_client or not self.config.get_prefetch_subdirs():
+            return
+
+        account = self.current_account
+        sub_dirs = [f.get('path') for f in files if f.get('isdir') and f.get('path')]
+        for path in sub_dirs[:FileConstants.PREFETCH_SUBDIR_LIMIT]:
+            if self.dir_cache.get(account, path) is not None:
+                continue
+            worker = Worker(func=_list_files_for_table, api_client=self.api_client,
+                            path=path, limit=FileConstants.LIST_PAGE_SIZE)
+            worker.finished.connect(functools.partial(self._on_subdirectory_prefetched, account, path))
+            worker.start(self._prefetch_pool)
+            self._prefetch_workers.append(worker)
+
+    def _on_subdirectory_prefetched(self, account, path, result):
+        """子目录预取完成，写入缓存"""
+        if isinstance(result, list) and result and account == self.current_account:
+            self.dir_cache.put(account, path, result)
+
+    def _invalidate_dir_cache(self, *paths):
+        """使指定目录的缓存失效（文件发生变化后调用）
+
+        当前目录只加载了部分分页时，本地增删改后服务器端的分页偏移已经变化，
+        current_file_list 也和表格不一致，继续按原偏移加载会漏掉或重复文件，
+        因此停止加载下一页，并从第一页重新加载。
+        """
+        for path in paths:
+            if path:
+                self.dir_cache.invalidate(self.current_account, path)
+
+        if self.current_path in paths and self._has_more_files:
+            self._has_more_files = False
+            self._retire_worker(self._more_files_worker)
+            self._more_files_worker = None
+            # 等调用方完成本次的表格修改后再重新加载
+            QTimer.singleShot(0, functools.partial(self._reload_first_page, self.current_path))
+
+    def _reload_first_page(self, path):
+        """从第一页重新加载目录（期间已切换到其他目录时不处理）"""
+        if path == self.current_path:
+            self.update_items(path, force=True)
+
     def on_directory_success(self, result):
         """目录加载成功回调"""
         self.is_loading_files = False  # 清除加载标志
         self.hide_status_progress()
 
         # 保存文件列表数据用于本地排序
-        self.current_file_list = result
+        self._reset_file_paging(result)
 
-        self.file_table.setRowCount(0)
         self.set_list_items(result)
         self.file_table.setEnabled(True)
         self.status_label.setText(f"已加载 {len(result)} 个项目")
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         # 重新启用所有按钮
         self._set_all_buttons_enabled(True)
 
@@ -3456,18 +3851,17 @@ class MainWindow(QMainWindow):
         self.file_table.setEnabled(True)
         self.status_label.setText(f"错误: {error_msg}")
         QMessageBox.critical(self, "错误", f"获取目录失败：{error_msg}")
-        self.current_worker = None
+        self._retire_worker(self.current_worker)
         # 重新启用所有按钮
         self._set_all_buttons_enabled(True)
 
     def get_list_files(self, path: str = '/'):
         if not self.api_client:
             return []
-        return self.api_client.list_files(path)
+        return self.api_client.list_files(path, limit=FileConstants.LIST_PAGE_SIZE)
 
     def on_login_success(self, result):
         """登录成功处理"""
-        print(f"登录成功，账号: {result['account_name']}")
         logger.info(f"🔐 登录成功，账号: {result['account_name']}")
 
         self.current_account = result['account_name']
@@ -3494,38 +3888,31 @@ class MainWindow(QMainWindow):
         """开始手动登录异步加载数据 - 并行加载三个请求"""
         self.show_status_progress("正在加载数据...")
 
-        # 使用线程池并行加载三个请求
-        import concurrent.futures
-
-        def load_all_data():
-            """并行加载所有数据"""
-            try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                    # 同时提交三个任务
-                    future_user = executor.submit(self.api_client.get_user_info)
-                    future_quota = executor.submit(self.api_client.get_quota)
-                    future_files = executor.submit(self.api_client.list_files, '/')
-
-                    # 等待所有任务完成
-                    results = {}
-                    for future, name in [(future_user, 'user'), (future_quota, 'quota'), (future_files, 'files')]:
-                        try:
-                            results[name] = future.result()
-                        except Exception as e:
-                            logger.error(f"加载{name}失败: {e}")
-                            results[name] = None
-
-                # 所有请求完成后，通过回调更新UI
-                callback = functools.partial(self._process_all_initial_data, results)
-                QTimer.singleShot(0, callback)
-
-            except Exception as e:
-                logger.error(f"并行加载数据出错: {e}")
-                callback = functools.partial(self._process_all_initial_data, {})
-                QTimer.singleShot(0, callback)
+        # 在线程池中并行加载所有数据，完成后通过信号回到主线程更新UI
+        self._login_worker = Worker(func=self._fetch_initial_data)
+        self._login_worker.finished.connect(self._process_all_initial_data)
+        self._login_worker.error.connect(lambda e: self._process_all_initial_data({}))
+        self._login_worker.start()
+
+    def _fetch_initial_data(self):
+        """并行获取用户信息、配额和根目录文件列表（在工作线程中执行）"""
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            # 同时提交三个任务
+            futures = {
+                'user': executor.submit(self.api_client.get_user_info),
+                'quota': executor.submit(self.api_client.get_quota),
+                'files': executor.submit(self.api_client.list_files, '/', limit=FileConstants.LIST_PAGE_SIZE),
+            }
 
-        thread = threading.Thread(target=load_all_data, daemon=True)
-        thread.start()
+            # 等待所有任务完成
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"加载{name}失败: {e}")
+                    results[name] = None
+        return results
 
     def _process_all_initial_data(self, results):
         """处理所有初始加载的数据"""
@@ -3537,18 +3924,7 @@ class MainWindow(QMainWindow):
         self._cached_quota_info = quota_info
 
         if user_info and quota_info:
-            used = quota_info.get('used', 0)
-            total = quota_info.get('total', 0)
-            used_gb = used / (1024 ** 3)
-            total_gb = total / (1024 ** 3)
-
-            baidu_name = user_info.get('baidu_name')
-            uk = user_info.get('uk')
-            info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
-
-            self.user_info_label.setText(info_text)
-            self.user_info_label_nav.setText(f"{baidu_name}")
-            logger.info(f"用户: {baidu_name} (UK: {uk})")
+            self._show_user_info(user_info, quota_info)
 
         self.show_status_progress("正在恢复任务...")
         QTimer.singleShot(10, lambda: self._finish_login_with_files(results.get('files')))
@@ -3574,65 +3950,16 @@ class MainWindow(QMainWindow):
         # 如果已经有文件列表，直接显示
         if files:
             self.current_path = '/'
+            self._store_dir_cache('/', files)
+            self._reset_file_paging(files)
             self.set_list_items(files)
+            self.file_table.setEnabled(True)
             # 加载完成后恢复按钮状态
             self._set_all_buttons_enabled(True)
         else:
             # 否则重新加载
             QTimer.singleShot(10, lambda: self.update_items("/"))
 
-    def _on_manual_user_info_loaded(self, user_info):
-        """手动登录 - 用户信息加载完成"""
-        self._cached_user_info = user_info
-        self.show_status_progress("正在加载配额信息...")
-
-        # 继续加载配额信息
-        worker2 = Worker(func=self.api_client.get_quota)
-        worker2.finished.connect(self._on_manual_quota_loaded)
-        worker2.error.connect(self._on_manual_quota_error)
-        worker2.start()
-
-    def _on_manual_user_info_error(self, error):
-        """手动登录 - 用户信息加载错误"""
-        logger.error(f"获取用户信息失败: {error}")
-        self._cached_user_info = None
-        # 继续加载配额
-        worker2 = Worker(func=self.api_client.get_quota)
-        worker2.finished.connect(self._on_manual_quota_loaded)
-        worker2.error.connect(self._on_manual_quota_error)
-        worker2.start()
-
-    def _on_manual_quota_loaded(self, quota_info):
-        """手动登录 - 配额信息加载完成"""
-        self._cached_quota_info = quota_info
-
-        # 更新UI显示
-        user_info = self._cached_user_info
-        if user_info and quota_info:
-            used = quota_info.get('used', 0)
-            total = quota_info.get('total', 0)
-            used_gb = used / (1024 ** 3)
-            total_gb = total / (1024 ** 3)
-
-            baidu_name = user_info.get('baidu_name')
-            uk = user_info.get('uk')
-            info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
-
-            self.user_info_label.setText(info_text)
-            self.user_info_label_nav.setText(f"{baidu_name}")
-            logger.info(f"用户: {baidu_name} (UK: {uk})")
-
-        self.show_status_progress("正在恢复任务...")
-        # 完成登录
-        QTimer.singleShot(10, self._finish_login)
-
-    def _on_manual_quota_error(self, error):
-        """手动登录 - 配额信息加载错误"""
-        logger.error(f"获取配额信息失败: {error}")
-        self._cached_quota_info = None
-        # 继续完成流程
-        QTimer.singleShot(10, self._finish_login)
-
     def _load_manual_login_data_sync(self):
         """同步加载手动登录数据（备用方案）"""
         try:
@@ -3646,18 +3973,7 @@ class MainWindow(QMainWindow):
 
             # 更新UI显示
             if user_info and quota_info:
-                used = quota_info.get('used', 0)
-                total = quota_info.get('total', 0)
-                used_gb = used / (1024 ** 3)
-                total_gb = total / (1024 ** 3)
-
-                baidu_name = user_info.get('baidu_name')
-                uk = user_info.get('uk')
-                info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
-
-                self.user_info_label.setText(info_text)
-                self.user_info_label_nav.setText(f"{baidu_name}")
-                logger.info(f"用户: {baidu_name} (UK: {uk})")
+                self._show_user_info(user_info, quota_info)
 
             self.show_status_progress("正在恢复任务...")
         except Exception as e:
@@ -3685,11 +4001,43 @@ class MainWindow(QMainWindow):
         self.hide_status_progress()
         QTimer.singleShot(10, lambda: self.update_items("/"))
 
+    def _ensure_api_client(self, account_name: Optional[str] = None, force: bool = False) -> bool:
+        """确保 API 客户端可用
+
+        每个账号使用自己的客户端：之前用过的直接复用，没有用过的新建，
+        force=True 时重新创建。指定账号时总是从配置中重新载入该账号的 token。
+
+        Args:
+            account_name: 需要切换到的账号，为空时只确保客户端存在
+            force: 是否强制重新创建
+
+        Returns:
+            bool: 是否已切换到指定账号（account_name 为空时恒为 True）
+        """
+        if not account_name:
+            if force or self.api_client is None:
+                self.api_client = BaiduPanAPI()
+            return True
+
+        # 只复用登记在该账号下的客户端，不把当前客户端登记到其他账号，
+        # 否则同一个对象出现在两个账号下，切换其中一个会改掉另一个的状态
+        client = None if force else self._api_clients.get(account_name)
+        if client is None:
+            client = BaiduPanAPI()
+        self.api_client = client
+
+        # 复用的客户端也重新读取配置并切换账号，载入登录对话框刚保存的 token，
+        # 不沿用自动登录失败时留下的过期 token
+        client.reload_config()
+        if not client.switch_account(account_name):
+            return False
+        self._api_clients[account_name] = client
+        return True
+
     def initialize_api_client(self):
-        self.api_client = BaiduPanAPI()
+        success = self._ensure_api_client(self.current_account)
 
         if self.current_account:
-            success = self.api_client.switch_account(self.current_account)
             if success:
                 logger.info(f"成功切换到账号: {self.current_account}")
             else:
@@ -3699,34 +4047,72 @@ class MainWindow(QMainWindow):
 
         # 同步 token 到 transfer_manager
         if self.api_client.access_token:
+            self.transfer_manager.api_client.clear_profile_cache()
             self.transfer_manager.api_client.access_token = self.api_client.access_token
             self.transfer_manager.api_client.current_account = self.api_client.current_account
             logger.info(f"已同步 token 到 transfer_manager")
 
     def update_user_info(self):
-        try:
-            user_info = self.api_client.get_user_info()
-            quota_info = self.api_client.get_quota()
-            used = quota_info.get('used', 0)
-            total = quota_info.get('total', 0)
-            used_gb = used / (1024 ** 3)
-            total_gb = total / (1024 ** 3)
+        """在后台线程中刷新用户信息和配额"""
+        if not self.api_client:
+            return
 
-            baidu_name = user_info.get('baidu_name')
-            uk = user_info.get('uk')
-            info_text = f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB"
+        # 切换账号时上一次的请求可能还没返回，丢弃它的结果，避免旧账号信息覆盖新账号
+        previous = self._user_info_worker
+        if previous is not None:
+            previous.stop()
+            self._retire_worker(previous)
 
-            self.user_info_label.setText(info_text)
-            self.user_info_label_nav.setText(f"{baidu_name}")
+        # 先显示占位文字，请求返回后再填充完整信息
+        self._set_user_info_text(f"用户: {self.current_account} (加载中...)", f"{self.current_account}")
 
-            logger.info(f"用户: {baidu_name} (UK: {uk})")
+        self._user_info_worker = Worker(func=self.api_client.get_user_profile_bundle)
+        self._user_info_worker.finished.connect(self._apply_user_info)
+        self._user_info_worker.error.connect(self._on_update_user_info_error)
+        self._user_info_worker.start()
 
+    def _apply_user_info(self, result):
+        """用户信息加载完成，更新界面"""
+        try:
+            user_info, quota_info = result
+            self._show_user_info(user_info, quota_info)
         except Exception as e:
-            print(f"更新用户信息时出错: {e}")
-            self.user_info_label.setText(f"用户: {self.current_account}")
-            self.user_info_label_nav.setText(f"{self.current_account}")
+            self._on_update_user_info_error(str(e))
+
+    def _on_update_user_info_error(self, error):
+        """用户信息加载失败，显示账号名"""
+        logger.error(f"更新用户信息时出错: {error}")
+        self._set_user_info_text(f"用户: {self.current_account}", f"{self.current_account}")
+
+    def _show_user_info(self, user_info, quota_info):
+        """
+        按用户信息和配额信息更新顶部标签
+
+        Args:
+            user_info: get_user_info 返回的用户信息
+            quota_info: get_quota 返回的配额信息
+        """
+        used_gb = quota_info.get('used', 0) / (1024 ** 3)
+        total_gb = quota_info.get('total', 0) / (1024 ** 3)
+        baidu_name = user_info.get('baidu_name')
+        uk = user_info.get('uk')
+
+        self._set_user_info_text(
+            f"用户: {baidu_name} (UK: {uk}) | 已用: {used_gb:.1f}GB / 总共: {total_gb:.1f}GB",
+            f"{baidu_name}")
+        logger.info(f"用户: {baidu_name} (UK: {uk})")
+
+    def _set_user_info_text(self, info_text, nav_text):
+        """设置用户信息标签，文字未变化时不调用 setText，避免重复刷新布局"""
+        if self.user_info_label.text() != info_text:
+            self.user_info_label.setText(info_text)
+        if self.user_info_label_nav.text() != nav_text:
+            self.user_info_label_nav.setText(nav_text)
 
     def open_authorization_dialog(self):
+        # 登录对话框依赖 QtWebEngine（体积大、加载慢），只在打开时才导入
+        from gui.login_dialog import LoginDialog
+
         login_dialog = LoginDialog()
         login_dialog.login_success.connect(self.on_login_success)
 
@@ -3770,7 +4156,6 @@ class MainWindow(QMainWindow):
 
             # 禁用主窗口，防止在切换过程中进行其他操作
             self.setEnabled(False)
-            QApplication.processEvents()  # 立即处理事件以更新UI
 
             # 创建账号选择对话框
             dialog = QDialog(self)
@@ -3848,6 +4233,7 @@ class MainWindow(QMainWindow):
             dialog.finished.connect(self._on_account_dialog_finished)
 
             dialog.exec_()
+            dialog.deleteLater()
 
         except Exception as e:
             logger.error(f"显示切换账号对话框时出错: {e}")
@@ -3879,13 +4265,13 @@ class MainWindow(QMainWindow):
             # 显示加载状态
             self.status_label.setText(f"正在切换到账号: {account_name}...")
             self.show_status_progress(f"正在切换账号...")
-            QApplication.processEvents()
 
-            # 执行切换
-            if self.api_client.switch_account(account_name):
+            # 执行切换（只更新本地配置和 token，用户信息和文件列表随后由后台任务加载）
+            if self._ensure_api_client(account_name):
                 self.current_account = account_name
 
                 # 同步 token 到 transfer_manager
+                self.transfer_manager.api_client.clear_profile_cache()
                 self.transfer_manager.api_client.access_token = self.api_client.access_token
                 self.transfer_manager.api_client.current_account = self.api_client.current_account
                 logger.info("已同步 token 到 transfer_manager")
@@ -3918,7 +4304,6 @@ class MainWindow(QMainWindow):
         """完成账号切换，恢复UI"""
         self.is_switching_account = False
         self.setEnabled(True)
-        QApplication.processEvents()
 
     def switch_to_account(self, dialog: QDialog, account_list: 'QListWidget'):
         """切换到选中的账号（按钮触发，需要确认）"""
@@ -3956,21 +4341,18 @@ class MainWindow(QMainWindow):
                 # 显示加载状态
                 self.status_label.setText(f"正在切换到账号: {account_name}...")
                 self.show_status_progress(f"正在切换账号...")
-                QApplication.processEvents()
 
-                # 执行切换
-                if self.api_client.switch_account(account_name):
+                # 执行切换（只更新本地配置和 token，用户信息和文件列表随后由后台任务加载）
+                if self._ensure_api_client(account_name):
                     self.current_account = account_name
 
                     # 同步 token 到 transfer_manager
+                    self.transfer_manager.api_client.clear_profile_cache()
                     self.transfer_manager.api_client.access_token = self.api_client.access_token
                     self.transfer_manager.api_client.current_account = self.api_client.current_account
 
                     # 停止所有正在进行的文件加载任务
-                    if self.current_worker and self.current_worker.isRunning():
-                        logger.info("停止正在进行的文件加载任务")
-                        self.current_worker.stop()
-                        self.current_worker.wait()
+                    self._stop_current_worker()
 
                     self.current_path = "/"
                     self.update_user_info()
@@ -4008,6 +4390,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.api_client:
                 self.api_client.logout()
+            self._api_clients.pop(self.current_account, None)
+            self.dir_cache.remove_account(self.current_account)
 
             self.current_account = None
             self.api_client = None
@@ -4028,6 +4412,16 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("已就绪")
         statusbar.addWidget(self.status_label, 1)
 
+        # 进度条和取消按钮在第一次显示进度时再创建
+        self.temp_widget = None
+        self.status_progress = None
+        self.cancel_button = None
+
+    def _ensure_progress_widgets(self):
+        """创建状态栏进度条和取消按钮（只创建一次）"""
+        if self.status_progress is not None:
+            return
+
         self.temp_widget = QWidget()
         temp_layout = QHBoxLayout(self.temp_widget)
         temp_layout.setContentsMargins(0, 0, 0, 0)
@@ -4047,7 +4441,7 @@ class MainWindow(QMainWindow):
         self.cancel_button.clicked.connect(self.cancel_current_operation)
         temp_layout.addWidget(self.cancel_button)
 
-        statusbar.addPermanentWidget(self.temp_widget)
+        self.statusBar().addPermanentWidget(self.temp_widget)
 
     def setup_menubar(self):
         menubar = self.menuBar()
@@ -4056,11 +4450,11 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu('文件(&F)')
 
         new_action = QAction('新建(&N)', self)
-        new_action.setShortcut('Ctrl+N')
+        new_action.setShortcut(_SC_NEW)
         file_menu.addAction(new_action)
 
         open_action = QAction('打开(&O)...', self)
-        open_action.setShortcut('Ctrl+O')
+        open_action.setShortcut(_SC_OPEN)
         file_menu.addAction(open_action)
 
         file_menu.addSeparator()
@@ -4068,7 +4462,7 @@ class MainWindow(QMainWindow):
         file_menu.addSeparator()
 
         exit_action = QAction('退出(&X)', self)
-        exit_action.setShortcut('Ctrl+Q')
+        exit_action.setShortcut(_SC_QUIT)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
@@ -4245,6 +4639,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
 
         dialog.exec_()
+        dialog.deleteLater()
 
     def browse_download_folder(self, dialog):
         """浏览并选择下载文件夹"""
@@ -4462,6 +4857,7 @@ class MainWindow(QMainWindow):
         self.update_format_preview()
 
         dialog.exec_()
+        dialog.deleteLater()
 
     def update_format_preview(self):
         """更新预览"""
@@ -4507,16 +4903,12 @@ class MainWindow(QMainWindow):
 
         layout = QVBoxLayout(dialog)
 
-        label = QLabel(f'''
-        <h2>百度网盘管理工具箱</h2>
-        <p>版本: {self.version_manager.get_current_version()}</p>
-        <p>一个简单易用的百度网盘管理工具</p>
-        <p>支持文件上传、下载、断点续传等功能</p>
-        ''')
+        label = QLabel(_ABOUT_HTML.format(version=self.version_manager.get_current_version()))
         label.setAlignment(Qt.AlignCenter)
         layout.addWidget(label)
 
         dialog.exec_()
+        dialog.deleteLater()
 
     def check_for_updates(self, auto_check=False):
         """
@@ -4553,34 +4945,94 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "检查更新", f"检查更新失败：{str(e)}")
 
     def show_status_progress(self, message="正在处理..."):
-        self.status_label.setText(message)
+        self._ensure_progress_widgets()
+        self._cancel_pending_status()
         self.status_progress.setRange(0, 0)
         self.status_progress.setVisible(True)
         self.cancel_button.setVisible(True)
         self.status_label.setText(message)
 
     def hide_status_progress(self):
-        self.status_progress.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.status_progress.setRange(0, 100)
+        self._cancel_pending_status()
+        if self.status_progress is not None:
+            self.status_progress.setVisible(False)
+            self.cancel_button.setVisible(False)
+            self.status_progress.setRange(0, 100)
         self.status_label.setText("已就绪")
         self.statusBar().clearMessage()
 
     def update_status_progress(self, value, message=""):
+        self._ensure_progress_widgets()
         if 0 <= value <= 100:
             self.status_progress.setRange(0, 100)
             self.status_progress.setValue(value)
 
         if message:
+            self._set_status(message, show_message=True)
+
+    def _set_status(self, message, show_message=False):
+        """
+        节流更新状态栏文字，逐个文件处理时只显示最新的一条
+
+        Args:
+            message: 状态文字
+            show_message: 是否同时通过 statusBar().showMessage 显示
+        """
+        self._pending_status = (message, show_message)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """把最新的状态文字写到状态栏"""
+        pending = self._pending_status
+        self._pending_status = None
+        if pending:
+            message, show_message = pending
             self.status_label.setText(message)
-            self.statusBar().showMessage(message)
+            if show_message:
+                self.statusBar().showMessage(message)
 
-    def cancel_current_operation(self):
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.stop()
-            self.current_worker.wait()
+    def _cancel_pending_status(self):
+        """丢弃尚未显示的进度文字，避免覆盖随后直接设置的状态"""
+        self._pending_status = None
+        self._status_timer.stop()
+
+    def _stop_current_worker(self):
+        """停止当前工作线程
+
+        断开 finished/error 信号后直接丢弃，不在界面线程上等待任务结束；
+        任务的结果会被忽略，不会回调到已经切换/销毁的界面上。
+        """
+        worker = self.current_worker
+        if not worker:
+            return
+
+        if worker.isRunning():
+            worker.stop()
+        self._retire_worker(worker)
+
+    def _retire_worker(self, worker):
+        """回收已结束或被取消的工作任务
+
+        断开 finished/error 信号并释放引用，让结果数据（如大目录列表）尽快被回收；
+        如果是当前任务，同时清空 self.current_worker。
+
+        Args:
+            worker: 要回收的任务
+        """
+        if worker is None:
+            return
+        for signal in (worker.finished, worker.error):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        if worker is self.current_worker:
             self.current_worker = None
 
+    def cancel_current_operation(self):
+        self._stop_current_worker()
+
         self.hide_status_progress()
         QApplication.restoreOverrideCursor()
         self.file_table.setEnabled(True)
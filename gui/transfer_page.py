@@ -3,14 +3,16 @@
 """
 import json
 import os
+import threading
 import time
+from datetime import datetime
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget,
     QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView, QSizePolicy,
     QMenu, QApplication, QMessageBox, QProgressBar, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThread, QThreadPool
 from PyQt5.QtGui import QColor, QFont
 
 from core.transfer_manager import TransferManager
@@ -21,6 +23,100 @@ from gui.style import AppStyles
 logger = get_logger(__name__)
 
 
+class UploadBatch(QObject):
+    """一批上传任务的提交进度
+
+    由 TransferPage.add_upload_tasks 创建，信号都在界面线程中发射。
+    线程池只读取文件大小，任务按拖放顺序在界面线程中逐个添加，
+    避免多个线程同时修改任务列表和断点续传文件。
+    """
+    file_submitted = pyqtSignal(int, str, bool, object)  # 序号, 文件路径, 是否添加成功, 文件大小（读取失败为 None）
+    progress = pyqtSignal(int, int)  # 已处理数量, 总数量
+    finished = pyqtSignal()  # 全部文件处理完毕
+    _result = pyqtSignal(int, str, object)  # 提交线程把读取到的文件大小送回界面线程
+
+    def __init__(self, total, add_task=None, parent=None):
+        """
+        初始化批次
+
+        Args:
+            total: 文件总数
+            add_task: 添加单个上传任务的函数，参数为 (文件路径, 文件大小)，返回任务或 None
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.total = total
+        self.done = 0
+        self._add_task = add_task
+        self._pending = {}  # 序号 -> (文件路径, 文件大小)，等待前面的文件处理完
+        self._next_index = 0
+        self._cancel_event = threading.Event()
+        self._result.connect(self._on_result)
+
+    def cancel(self):
+        """取消尚未开始处理的文件"""
+        self._cancel_event.set()
+
+    def is_canceled(self) -> bool:
+        """是否已取消"""
+        return self._cancel_event.is_set()
+
+    def _on_result(self, index, file_path, file_size):
+        self._pending[index] = (file_path, file_size)
+        # 按序号顺序添加任务，后面的文件先读完时先暂存
+        while self._next_index in self._pending:
+            index = self._next_index
+            self._next_index += 1
+            file_path, file_size = self._pending.pop(index)
+            success = self._submit(file_path, file_size)
+
+            # 接收方（如模态进度框的 setValue）可能处理事件导致重入，这里用局部变量记录本次的计数
+            self.done += 1
+            done = self.done
+            self.file_submitted.emit(index, file_path, success, file_size)
+            self.progress.emit(done, self.total)
+            if done == self.total:
+                self.finished.emit()
+                self.deleteLater()
+
+    def _submit(self, file_path, file_size) -> bool:
+        """添加单个上传任务，返回是否成功"""
+        if not file_size or self.is_canceled() or self._add_task is None:
+            return False
+        try:
+            return self._add_task(file_path, file_size) is not None
+        except Exception as e:
+            logger.error(f"添加上传任务失败 {file_path}: {e}")
+            return False
+
+
+class _UploadSubmitter(QRunnable):
+    """在线程池中读取单个文件的大小"""
+
+    def __init__(self, batch, index, file_path):
+        """
+        初始化提交任务
+
+        Args:
+            batch: 所属的上传批次
+            index: 文件序号
+            file_path: 本地文件路径
+        """
+        super().__init__()
+        self.batch = batch
+        self.index = index
+        self.file_path = file_path
+
+    def run(self):
+        file_size = None
+        try:
+            if not self.batch.is_canceled():
+                file_size = os.path.getsize(self.file_path)
+        except Exception as e:
+            logger.error(f"处理文件失败 {self.file_path}: {e}")
+        self.batch._result.emit(self.index, self.file_path, file_size)
+
+
 class TransferPage(QWidget):
     """传输页面"""
 
@@ -36,6 +132,7 @@ class TransferPage(QWidget):
 
         self.resume_data_dir = "resume_data"
         self._ensure_resume_dir()
+        self._submit_pool = None  # 批量添加上传任务的线程池
 
         self.setup_ui()
         self.setup_timer()
@@ -484,10 +581,18 @@ class TransferPage(QWidget):
         else:
             return f"{speed / (1024 * 1024):.1f} MB/s"
 
-    def add_upload_task(self, file_path, remote_path="/", enable_resume=True):
-        """添加上传任务"""
+    def add_upload_task(self, file_path, remote_path="/", enable_resume=True, file_size=None):
+        """添加上传任务
+
+        Args:
+            file_path: 本地文件路径
+            remote_path: 上传到的网盘目录
+            enable_resume: 是否加载断点续传数据
+            file_size: 已知的文件大小，调用方已读取过时传入，避免重复 stat
+        """
         file_name = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path)
+        if file_size is None:
+            file_size = os.path.getsize(file_path)
 
         if file_size == 0:
             return None
@@ -522,6 +627,41 @@ class TransferPage(QWidget):
         self.start_upload_task(task)
         return task
 
+    def add_upload_tasks(self, file_paths, remote_path="/"):
+        """
+        批量添加上传任务
+
+        文件大小在线程池中读取，任务按顺序在界面线程中添加，
+        通过返回的 UploadBatch 信号报告进度。
+
+        Args:
+            file_paths: 本地文件路径列表
+            remote_path: 上传到的网盘目录
+
+        Returns:
+            UploadBatch: 本批次的进度对象
+        """
+        def add_task(file_path, file_size):
+            # 添加上传任务（大文件自动启用分片上传和断点续传）
+            return self.add_upload_task(file_path, remote_path, enable_resume=True, file_size=file_size)
+
+        batch = UploadBatch(len(file_paths), add_task, self)
+        if not file_paths:
+            QTimer.singleShot(0, batch.finished.emit)
+            return batch
+
+        pool = self._get_submit_pool()
+        for index, file_path in enumerate(file_paths):
+            pool.start(_UploadSubmitter(batch, index, file_path))
+        return batch
+
+    def _get_submit_pool(self) -> QThreadPool:
+        """获取提交上传任务使用的线程池（首次使用时创建）"""
+        if self._submit_pool is None:
+            self._submit_pool = QThreadPool(self)
+            self._submit_pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 3))
+        return self._submit_pool
+
     def add_download_task(self, file_name, remote_path, file_size=0, local_path=None):
         """添加下载任务"""
         logger.info(f"添加下载任务: {file_name}")
@@ -658,7 +798,6 @@ class TransferPage(QWidget):
             size_mb: 文件大小（MB）
         """
         import tempfile
-        from datetime import datetime
 
         # 检查是否有api_client
         if not self.parent_window or not self.parent_window.api_client:
@@ -1,12 +1,17 @@
 """
 自定义表格部件
 """
+import logging
 import os
 
 from PyQt5.QtWidgets import QTableWidget, QAbstractItemView, QToolTip, QTableWidgetItem
 from PyQt5.QtCore import Qt, QEvent, pyqtSignal, QPoint
 from PyQt5.QtGui import QDrag, QPixmap, QColor, QBrush, QFont
 
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class AutoTooltipTableWidget(QTableWidget):
     """自动检测文本截断并显示 tooltip 的表格"""
@@ -84,7 +89,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
 
             # 检查是否有选中项
             if self.selectedItems():
-                print("[DEBUG] 触发手动拖拽")
+                logger.debug("触发手动拖拽")
                 self._start_internal_drag()
 
         super().mouseMoveEvent(event)
@@ -101,7 +106,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
             rows.add(item.row())
 
         self.dragging_rows = list(rows)
-        print(f"[DEBUG] 开始拖拽 {len(self.dragging_rows)} 行")
+        logger.debug("开始拖拽 %d 行", len(self.dragging_rows))
 
         # 创建拖拽对象
         drag = QDrag(self)
@@ -118,7 +123,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
 
         # 执行拖拽
         result = drag.exec_(Qt.CopyAction | Qt.MoveAction, Qt.MoveAction)
-        print(f"[DEBUG] 拖拽完成，结果={result}")
+        logger.debug("拖拽完成，结果=%s", result)
 
         # 清空拖拽行
         self.dragging_rows = []
@@ -199,7 +204,9 @@ class DragDropTableWidget(AutoTooltipTableWidget):
 
     def dragEnterEvent(self, event):
         """处理拖拽进入事件"""
-        print(f"[DEBUG] dragEnterEvent: hasUrls={event.mimeData().hasUrls()}, hasFormat={event.mimeData().hasFormat('application/x-qabstractitemmodeldatalist')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("dragEnterEvent: hasUrls=%s, hasFormat=%s", event.mimeData().hasUrls(),
+                         event.mimeData().hasFormat('application/x-qabstractitemmodeldatalist'))
         # 支持外部文件拖拽和内部行拖拽
         if event.mimeData().hasUrls() or event.mimeData().hasFormat("application/x-qabstractitemmodeldatalist"):
             event.acceptProposedAction()
@@ -233,7 +240,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
 
     def dropEvent(self, event):
         """处理拖放事件"""
-        print(f"[DEBUG] dropEvent: hasUrls={event.mimeData().hasUrls()}")
+        logger.debug("dropEvent: hasUrls=%s", event.mimeData().hasUrls())
         self.drag_active = False
         self.setStyleSheet("")  # 恢复样式
         self._clear_highlight()  # 清除高亮
@@ -261,7 +268,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
 
         # 处理内部行拖拽
         if event.mimeData().hasFormat("application/x-qabstractitemmodeldatalist"):
-            print(f"[DEBUG] 内部拖拽检测到，dragging_rows={self.dragging_rows}")
+            logger.debug("内部拖拽检测到，dragging_rows=%s", self.dragging_rows)
             # 获取目标位置
             target_pos = event.pos()
             target_item = self.itemAt(target_pos)
@@ -269,7 +276,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
             if target_item and self.dragging_rows:
                 # 检查目标是文件夹
                 target_data = target_item.data(Qt.UserRole)
-                print(f"[DEBUG] 目标项: is_dir={target_data.get('is_dir') if target_data else None}")
+                logger.debug("目标项: is_dir=%s", target_data.get('is_dir') if target_data else None)
 
                 if target_data and target_data.get('is_dir'):
                     # 收集要移动的文件信息
@@ -284,7 +291,7 @@ class DragDropTableWidget(AutoTooltipTableWidget):
                     if moved_rows_data:
                         # 获取目标文件夹路径
                         target_path = target_data.get('path', '')
-                        print(f"[DEBUG] 发射移动信号: {len(moved_rows_data)} 个文件到 {target_path}")
+                        logger.debug("发射移动信号: %d 个文件到 %s", len(moved_rows_data), target_path)
                         # 发射信号，通知主窗口移动文件
                         self.rows_moved.emit(moved_rows_data, target_path)
                         event.accept()
@@ -292,10 +299,10 @@ class DragDropTableWidget(AutoTooltipTableWidget):
                         event.ignore()
                 else:
                     # 目标不是文件夹，忽略
-                    print("[DEBUG] 目标不是文件夹，忽略")
+                    logger.debug("目标不是文件夹，忽略")
                     event.ignore()
             else:
-                print(f"[DEBUG] target_item={target_item}, dragging_rows={self.dragging_rows}")
+                logger.debug("target_item=%s, dragging_rows=%s", target_item, self.dragging_rows)
                 event.ignore()
 
             self.dragging_rows = []  # 清空拖拽行
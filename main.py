@@ -244,6 +244,9 @@ def main():
         check_and_replace_old_version()
         main_debug_log("check_and_replace_old_version() 执行完成")
 
+        # 登录对话框中的 QtWebEngine 改为按需导入，需要在创建 QApplication 之前设置共享 OpenGL 上下文
+        QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
         # 创建应用
         app = QApplication(sys.argv)
         app.setApplicationName('百度网盘工具箱')
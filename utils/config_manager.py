@@ -1,7 +1,10 @@
 """
 配置管理模块
 """
+import copy
 import json
+import hashlib
+import threading
 import time
 import sys
 import os
@@ -36,6 +39,7 @@ DEFAULT_CONFIG = {
     'current_account': None,
     'download_path': os.path.join(os.path.expanduser("~"), "Downloads"),  # 默认下载路径
     'max_download_threads': 4,
+    'prefetch_subdirs': False,  # 加载目录后在后台预取子目录列表（每次进入目录会多发请求，默认关闭）
     'share_config': {
         'period': 7,
         'pwd_type': 'random',
@@ -49,6 +53,11 @@ DEFAULT_CONFIG = {
 class ConfigManager:
     """配置管理器"""
 
+    # 按文件路径缓存解析结果: path -> (stat 签名, sha256, 配置字典)
+    # 各处频繁创建 ConfigManager，文件未变化时不再重复读取和解析
+    _parse_cache: Dict[str, tuple] = {}
+    _parse_cache_lock = threading.Lock()
+
     def __init__(self, config_file: str = 'config.json'):
         # 配置文件保存在运行目录下
         config_path = os.path.join(get_runtime_dir(), config_file)
@@ -63,19 +72,77 @@ class ConfigManager:
             return DEFAULT_CONFIG.copy()
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
+            cached = self._get_cached_config()
+            if cached is not None:
+                return cached
+
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+            user_config = json.loads(raw.decode('utf-8'))
 
             # 合并默认配置，确保所有必需的键都存在
             for key, value in DEFAULT_CONFIG.items():
                 if key not in user_config:
                     user_config[key] = value
 
+            self._update_parse_cache(hashlib.sha256(raw).hexdigest(), user_config)
             return user_config
-        except (json.JSONDecodeError, IOError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
             logger.error(f"加载配置文件失败，使用默认配置: {e}")
             return DEFAULT_CONFIG.copy()
 
+    def _stat_signature(self) -> Optional[tuple]:
+        """配置文件的 (修改时间, 大小)，文件不存在时返回 None"""
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _file_sha256(path: Path, chunk_size: int = 64 * 1024) -> str:
+        """分块计算文件的 sha256"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _get_cached_config(self) -> Optional[Dict[str, Any]]:
+        """
+        从解析缓存中取配置
+
+        stat 签名一致时直接命中；签名变化但内容哈希一致（如仅被 touch）时也命中。
+
+        Returns:
+            配置字典的副本，未命中时返回 None
+        """
+        key = str(self.config_file)
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+        if cached is None:
+            return None
+
+        signature = self._stat_signature()
+        if signature is None:
+            return None
+        if signature != cached[0]:
+            if self._file_sha256(self.config_file) != cached[1]:
+                return None
+            with self._parse_cache_lock:
+                self._parse_cache[key] = (signature, cached[1], cached[2])
+
+        # 返回副本，各实例修改配置时互不影响
+        return copy.deepcopy(cached[2])
+
+    def _update_parse_cache(self, sha: str, config: Dict[str, Any]) -> None:
+        """记录当前文件内容对应的配置"""
+        signature = self._stat_signature()
+        if signature is None:
+            return
+        with self._parse_cache_lock:
+            self._parse_cache[str(self.config_file)] = (signature, sha, copy.deepcopy(config))
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         获取配置值
@@ -143,8 +210,10 @@ class ConfigManager:
             # 确保目录存在
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=4)
+            raw = json.dumps(config, ensure_ascii=False, indent=4).encode('utf-8')
+            with open(self.config_file, 'wb') as f:
+                f.write(raw)
+            self._update_parse_cache(hashlib.sha256(raw).hexdigest(), config)
 
             logger.debug(f"配置已保存到: {self.config_file}")
             return True
@@ -340,6 +409,17 @@ class ConfigManager:
         threads = max(1, min(8, threads))
         self.set('max_download_threads', threads)
         return self.save()
+
+    def get_prefetch_subdirs(self) -> bool:
+        """是否在后台预取子目录列表
+
+        开启后每次进入目录最多额外请求 PREFETCH_SUBDIR_LIMIT 个子目录，默认关闭。
+
+        Returns:
+            是否启用预取
+        """
+        return bool(self.get('prefetch_subdirs', False))
+
     def get_share_config(self) -> Dict[str, Any]:
         """获取分享配置
 
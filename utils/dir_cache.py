@@ -0,0 +1,256 @@
+"""
+目录列表缓存模块
+内存 LRU + 磁盘 JSON 两级缓存，减少重复的 list_files 请求
+"""
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from utils.config_manager import get_runtime_dir
+from utils.logger import get_logger
+from core.constants import FileConstants
+
+logger = get_logger(__name__)
+
+
+class DirCache:
+    """目录列表缓存
+
+    以 (账号, 路径) 为键，内存中按 LRU 淘汰，同时写入磁盘，
+    内存未命中时再从磁盘读取。超过 TTL 的条目视为过期。
+
+    磁盘读写之外的写入和删除都交给单个后台线程按顺序执行，
+    同一目录还没写入时再次写入只保留最新的一份，不阻塞界面线程。
+    磁盘缓存按账号分目录保存，便于整体清除。
+    """
+
+    def __init__(self, ttl: float = FileConstants.DIR_CACHE_TTL,
+                 max_entries: int = FileConstants.DIR_CACHE_MAX_ENTRIES,
+                 cache_dir: Optional[str] = None):
+        """
+        初始化目录缓存
+
+        Args:
+            ttl: 缓存有效期（秒）
+            max_entries: 内存中最多保留的目录数量
+            cache_dir: 磁盘缓存目录，默认为运行目录下的 cache/dir_listing
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir or os.path.join(get_runtime_dir(), 'cache', 'dir_listing')
+        # key -> (写入时间, 文件列表)，写入时间使用 time.time() 以便跨进程持久化
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # 预取线程也会写缓存，需要加锁
+        self._lock = threading.Lock()
+        # 等待后台线程处理的磁盘操作：key -> (磁盘路径, 条目)，条目为 None 表示删除
+        self._pending: Dict[str, tuple] = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dir_cache')
+
+    @staticmethod
+    def _make_key(account: Optional[str], path: str) -> str:
+        """生成缓存键（规范化路径，去掉末尾的 /）"""
+        path = '/' + path.strip('/')
+        return f"{account or ''}:{path}"
+
+    def _account_dir(self, account: Optional[str]) -> str:
+        """账号的磁盘缓存目录（目录名为账号名的哈希）"""
+        digest = hashlib.sha256((account or '').encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest[:16])
+
+    def _disk_path(self, account: Optional[str], key: str) -> str:
+        """缓存文件路径，按哈希前两位分目录，避免单个目录下文件过多"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self._account_dir(account), digest[:2], f"{digest}.json")
+
+    def get(self, account: Optional[str], path: str, max_age: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取缓存的目录列表
+
+        Args:
+            account: 账号名
+            path: 目录路径
+            max_age: 最大允许的缓存时长（秒），默认使用 ttl
+
+        Returns:
+            文件列表，未命中或已过期时返回 None
+        """
+        key = self._make_key(account, path)
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] < max_age:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+            # 还在等待写入磁盘的条目（或已失效等待删除）以队列中的为准
+            pending = self._pending.get(key)
+        if pending is not None:
+            entry = pending[1]
+        else:
+            entry = self._load_from_disk(self._disk_path(account, key))
+        if entry is None or now - entry[0] >= max_age:
+            return None
+
+        with self._lock:
+            self._store(key, entry)
+        return entry[1]
+
+    def put(self, account: Optional[str], path: str, files: List[Dict[str, Any]]) -> None:
+        """
+        写入目录列表
+
+        Args:
+            account: 账号名
+            path: 目录路径
+            files: 文件列表
+        """
+        key = self._make_key(account, path)
+        entry = (time.time(), files)
+        with self._lock:
+            self._store(key, entry)
+        self._schedule(key, self._disk_path(account, key), entry)
+
+    def invalidate(self, account: Optional[str], path: str) -> None:
+        """
+        使指定目录的缓存失效
+
+        Args:
+            account: 账号名
+            path: 目录路径
+        """
+        key = self._make_key(account, path)
+        with self._lock:
+            self._entries.pop(key, None)
+        self._schedule(key, self._disk_path(account, key), None)
+
+    def remove_account(self, account: Optional[str]) -> None:
+        """
+        清除账号的全部缓存（退出登录时调用）
+
+        Args:
+            account: 账号名
+        """
+        prefix = self._make_key(account, '/')[:-1]
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+            for key in [k for k in self._pending if k.startswith(prefix)]:
+                del self._pending[key]
+        # 排在已提交的写入之后执行，不会被之后完成的写入重新创建
+        self._writer.submit(shutil.rmtree, self._account_dir(account), True)
+
+    def prune(self, accounts: List[Optional[str]]) -> None:
+        """
+        在后台清理磁盘缓存（启动时调用）
+
+        删除不在 accounts 中的账号（已退出或已删除）的缓存和旧格式的缓存文件，
+        以及过期的目录列表。根目录列表保留，启动时先显示上次的内容。
+
+        Args:
+            accounts: 仍然保存的账号
+        """
+        keep = {}
+        for account in accounts:
+            root_key = self._make_key(account, '/')
+            keep[os.path.basename(self._account_dir(account))] = self._disk_path(account, root_key)
+        self._writer.submit(self._prune_disk, keep)
+
+    def clear(self) -> None:
+        """清空内存缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def _schedule(self, key: str, file_path: str, entry: Optional[tuple]) -> None:
+        """登记磁盘写入或删除，由后台线程执行"""
+        with self._lock:
+            idle = not self._pending
+            self._pending[key] = (file_path, entry)
+        if idle:
+            self._writer.submit(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """后台线程：依次处理登记的磁盘操作，直到队列为空"""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                key = next(iter(self._pending))
+                file_path, entry = self._pending[key]
+            if entry is None:
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+            else:
+                self._save_to_disk(key, file_path, entry)
+            with self._lock:
+                # 处理期间同一目录又有新的操作时保留新的，下一轮再处理
+                current = self._pending.get(key)
+                if current is not None and current[1] is entry:
+                    del self._pending[key]
+
+    def _prune_disk(self, keep: Dict[str, str]) -> None:
+        """后台线程：清理不需要的磁盘缓存"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        now = time.time()
+        removed = 0
+        for name in names:
+            account_dir = os.path.join(self.cache_dir, name)
+            if name not in keep:
+                shutil.rmtree(account_dir, True)
+                removed += 1
+                continue
+            for dir_path, _, file_names in os.walk(account_dir):
+                for file_name in file_names:
+                    file_path = os.path.join(dir_path, file_name)
+                    if file_path == keep[name]:
+                        continue
+                    try:
+                        if now - os.path.getmtime(file_path) >= self.ttl:
+                            os.remove(file_path)
+                            removed += 1
+                    except OSError:
+                        pass
+        if removed:
+            logger.debug(f"已清理 {removed} 项目录缓存")
+
+    def _store(self, key: str, entry: tuple) -> None:
+        """写入内存并按 LRU 淘汰（调用方需持有锁）"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load_from_disk(self, file_path: str) -> Optional[tuple]:
+        """从磁盘读取缓存条目"""
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data['timestamp'], data['files']
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"读取目录缓存失败: {e}")
+            return None
+
+    def _save_to_disk(self, key: str, file_path: str, entry: tuple) -> None:
+        """将缓存条目写入磁盘（在后台线程中调用）"""
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'timestamp': entry[0], 'files': entry[1]}, f, ensure_ascii=False)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"写入目录缓存失败: {e}")
@@ -7,38 +7,44 @@ import time
 import os
 from typing import Dict, Any, List
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
 
 from utils.logger import get_logger
 from core.models import ScanResult, FileInfo, FileSystemInfo
 
 logger = get_logger(__name__)
 
+# 文件大小单位
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 class FileUtils:
     """文件工具类"""
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_size(size_bytes: int) -> str:
-        """格式化文件大小"""
+        """格式化文件大小（结果缓存，文件列表中大量重复的大小只格式化一次）"""
         if size_bytes == 0:
             return "0 B"
 
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(size_bytes)
+        # 按二进制位数直接确定单位（每 10 位一级），不再循环除以 1024
         i = 0
+        if size_bytes >= 1024:
+            i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-        while size >= 1024 and i < len(units) - 1:
-            size /= 1024.0
-            i += 1
-
-        return f"{size:.2f} {units[i]}"
+        return f"{size_bytes / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def format_time(timestamp: int) -> str:
-        """格式化时间戳"""
+        """格式化时间戳（结果缓存，同一批上传的文件时间戳往往相同）
+
+        显示精度为秒，不能按分钟合并缓存键，所以缓存容量比 format_size 大一些。
+        使用 time.strftime 而不是 datetime，不需要构造 datetime 对象，未命中缓存时也更快。
+        """
         if timestamp:
-            return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
         return ""
 
     @staticmethod
@@ -1,11 +1,18 @@
 """
 日志配置模块
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from datetime import datetime
 
+# 所有 logger 共享的日志队列和后台监听器，控制台/文件 IO 在监听线程中完成，不阻塞界面线程
+_log_queue = None
+_queue_listener = None
+
 
 # 获取运行目录（程序所在目录）
 def get_runtime_dir():
@@ -80,31 +87,48 @@ def get_logger(name: str = None, level: int = logging.INFO) -> logging.Logger:
     logger.setLevel(level)
 
     if not logger.handlers:
-        # 控制台处理器 - 使用彩色格式化器
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(ColorFormatter())
-        logger.addHandler(console_handler)
-
-        # 文件处理器 - 使用普通格式化器，日志文件按日期保存在 log 文件夹下
-        # 文件名格式：baidu_pan_tool_2026-01-13.log
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        log_file = os.path.join(get_log_dir(), f'baidu_pan_tool_{current_date}.log')
-
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(
-            logging.Formatter(
-                ColorFormatter.DEFAULT_FORMAT,
-                datefmt=ColorFormatter.DATE_FORMAT
-            )
+        # 只把日志记录放入队列，由监听线程写控制台和文件
+        logger.addHandler(logging.handlers.QueueHandler(_get_log_queue()))
+
+    return logger
+
+
+def _get_log_queue() -> queue.Queue:
+    """获取共享日志队列（首次调用时创建处理器并启动监听线程）"""
+    global _log_queue, _queue_listener
+    if _log_queue is not None:
+        return _log_queue
+
+    # 控制台处理器 - 使用彩色格式化器，级别由各 logger 自己控制
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(ColorFormatter())
+
+    # 文件处理器 - 使用普通格式化器，日志文件按日期保存在 log 文件夹下
+    # 文件名格式：baidu_pan_tool_2026-01-13.log
+    current_date = datetime.now().strftime('%Y-%m-%d')
+    log_file = os.path.join(get_log_dir(), f'baidu_pan_tool_{current_date}.log')
+
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(
+        logging.Formatter(
+            ColorFormatter.DEFAULT_FORMAT,
+            datefmt=ColorFormatter.DATE_FORMAT
         )
-        logger.addHandler(file_handler)
+    )
 
-        # 清理7天前的日志文件
-        _cleanup_old_logs()
+    _log_queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        _log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    # 退出时把队列中剩余的日志写完
+    atexit.register(_queue_listener.stop)
 
-    return logger
+    # 清理7天前的日志文件
+    _cleanup_old_logs()
+
+    return _log_queue
 
 
 def _cleanup_old_logs():
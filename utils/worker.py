@@ -1,18 +1,46 @@
 """
 工作线程模块
 """
-from PyQt5.QtCore import QThread, pyqtSignal
+import threading
 
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 
-class Worker(QThread):
-    """通用工作线程类"""
+# 正在执行或排队中的任务，保持 Python 引用，防止任务运行中被回收
+_active_workers = set()
+_pool_configured = False
+
+
+def get_thread_pool() -> QThreadPool:
+    """获取共享线程池（首次调用时设置最大线程数）
+
+    预留部分核心给界面线程、传输线程和预取线程池，
+    最大线程数为 idealThreadCount() - 3，至少 2 个。
+    """
+    global _pool_configured
+    pool = QThreadPool.globalInstance()
+    if not _pool_configured:
+        pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 3))
+        _pool_configured = True
+    return pool
+
+
+class WorkerSignals(QObject):
+    """工作任务信号"""
     finished = pyqtSignal(object)  # 完成任务时发射，传递结果
     error = pyqtSignal(str)  # 发生错误时发射
     progress = pyqtSignal(int, str)
 
+
+class Worker(QRunnable):
+    """通用工作任务类
+
+    提交到共享线程池执行，避免每次操作都创建新线程；
+    保留 start/stop/wait/isRunning 和 finished/error/progress 信号等原有接口。
+    """
+
     def __init__(self, func, *args, **kwargs):
         """
-        初始化工作线程
+        初始化工作任务
 
         Args:
             func: 要执行的函数
@@ -20,21 +48,77 @@ class Worker(QThread):
             **kwargs: 函数的关键字参数
         """
         super().__init__()
+        # 由 Python 管理生命周期，避免线程池执行完后销毁 C++ 对象
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
         self.func = func
         self.args = args
         self.kwargs = kwargs
         self._is_running = True
+        self._started = False
+        self._done = threading.Event()
+        self._pool = None
+
+    @property
+    def finished(self):
+        return self.signals.finished
+
+    @property
+    def error(self):
+        return self.signals.error
+
+    @property
+    def progress(self):
+        return self.signals.progress
+
+    def start(self, pool: QThreadPool = None):
+        """
+        提交到线程池执行
+
+        Args:
+            pool: 使用的线程池，默认为共享线程池
+        """
+        self._pool = pool or get_thread_pool()
+        self._started = True
+        self._done.clear()
+        _active_workers.add(self)
+        self._pool.start(self)
 
     def run(self):
         """执行任务"""
         try:
+            if not self._is_running:
+                return
             result = self.func(*self.args, **self.kwargs)
             if self._is_running:
-                self.finished.emit(result)
+                self.signals.finished.emit(result)
         except Exception as e:
             if self._is_running:
-                self.error.emit(str(e))
+                self.signals.error.emit(str(e))
+        finally:
+            self._done.set()
+            _active_workers.discard(self)
 
     def stop(self):
-        """停止任务"""
-        self._is_running = False
\ No newline at end of file
+        """停止任务（尚未开始执行的任务直接从线程池队列中移除）"""
+        self._is_running = False
+        if self._started and not self._done.is_set() and self._pool.tryTake(self):
+            self._done.set()
+            _active_workers.discard(self)
+
+    def isRunning(self) -> bool:
+        """任务是否已提交且尚未结束"""
+        return self._started and not self._done.is_set()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """等待任务结束
+
+        Args:
+            msecs: 超时时间（毫秒），负数表示一直等待
+
+        Returns:
+            bool: 任务是否已结束
+        """
+        if not self._started:
+            return True
+        return self._done.wait(None if msecs < 0 else msecs / 1000)